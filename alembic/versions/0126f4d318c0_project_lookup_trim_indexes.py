@@ -0,0 +1,53 @@
+"""add trimmed state and credit rating indexes
+
+Revision ID: 0126f4d318c0
+Revises: 491fe8177a72
+Create Date: 2026-10-17 09:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0126f4d318c0'
+down_revision: Union[str, Sequence[str], None] = '491fe8177a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Expression indexes behind the distinct state / credit rating filter lookups;
+# partial on the same predicate the lookup queries use
+INDEXES = [
+    ('ix_projects_state_trim', 'state'),
+    ('ix_projects_credit_rating_trim', 'municipality_credit_rating'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, column in INDEXES:
+            op.create_index(
+                index_name,
+                'perdix_mp_projects',
+                [sa.text(f'trim({column})')],
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(f"{column} IS NOT NULL AND trim({column}) <> ''"),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, _ in reversed(INDEXES):
+            op.drop_index(
+                index_name,
+                table_name='perdix_mp_projects',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,46 @@
+"""add covering index for the commitments summary
+
+Revision ID: 017537b0fbae
+Revises: 0126f4d318c0
+Create Date: 2026-10-17 09:13:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017537b0fbae'
+down_revision: Union[str, Sequence[str], None] = '0126f4d318c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the commitments table stays writable during the build
+    with op.get_context().autocommit_block():
+        # Every column the commitments summary aggregates and the best-deal
+        # lookup reads, so both can run as index-only scans
+        op.create_index(
+            'ix_commitments_summary',
+            'perdix_mp_commitments',
+            ['project_id', 'status', sa.text('created_at DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_include=['amount', 'interest_rate', 'funding_mode'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_commitments_summary',
+            table_name='perdix_mp_commitments',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""add commitment project committer index
+
+Revision ID: 0bd51924c8d8
+Revises: 15497f848046
+Create Date: 2026-10-17 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0bd51924c8d8'
+down_revision: Union[str, Sequence[str], None] = '15497f848046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the commitments table stays writable during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_commitments_project_committer_created_at',
+            'perdix_mp_commitments',
+            ['project_id', 'committed_by', sa.text('created_at DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_commitments_project_committer_created_at',
+            table_name='perdix_mp_commitments',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
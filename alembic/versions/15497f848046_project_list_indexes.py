@@ -0,0 +1,64 @@
+"""add project list and rejection history indexes
+
+Revision ID: 15497f848046
+Revises: b478fee192be
+Create Date: 2026-10-17 09:04:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '15497f848046'
+down_revision: Union[str, Sequence[str], None] = 'b478fee192be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns); built concurrently so the tables stay writable
+INDEXES = [
+    (
+        'ix_projects_created_at_id',
+        'perdix_mp_projects',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    ),
+    (
+        'ix_projects_status_created_at',
+        'perdix_mp_projects',
+        ['status', sa.text('created_at DESC')],
+    ),
+    (
+        'ix_rejection_history_project_rejected_at',
+        'perdix_mp_project_rejection_history',
+        ['project_id', sa.text('rejected_at DESC')],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,45 @@
+"""add partial index for fully funded projects listing
+
+Revision ID: 25862ca894ae
+Revises: 9dd6b887e98d
+Create Date: 2026-10-17 09:07:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '25862ca894ae'
+down_revision: Union[str, Sequence[str], None] = '9dd6b887e98d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only 'funding_completed' rows, already in listing order: the fully funded
+    # page is a range scan of a small index with no filter or sort step
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_projects_funded_created_at_id',
+            'perdix_mp_projects',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_where=sa.text("status = 'funding_completed'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_projects_funded_created_at_id',
+            table_name='perdix_mp_projects',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,45 @@
+"""add question status listing index
+
+Revision ID: 47828b90b8d5
+Revises: b80760ccae72
+Create Date: 2026-10-17 09:16:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '47828b90b8d5'
+down_revision: Union[str, Sequence[str], None] = 'b80760ccae72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the questions table stays writable during the build
+    with op.get_context().autocommit_block():
+        # Listing a project's questions by status walks one index range in page
+        # order instead of filtering the project's whole listing
+        op.create_index(
+            'ix_questions_project_status_created_at_id',
+            'perdix_mp_questions',
+            ['project_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_questions_project_status_created_at_id',
+            table_name='perdix_mp_questions',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
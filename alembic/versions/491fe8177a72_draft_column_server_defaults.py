@@ -0,0 +1,39 @@
+"""add server defaults to project draft columns
+
+Revision ID: 491fe8177a72
+Revises: 709719654a8b
+Create Date: 2026-10-17 09:11:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '491fe8177a72'
+down_revision: Union[str, Sequence[str], None] = '709719654a8b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Column -> server default applied by the database on INSERT
+DRAFT_SERVER_DEFAULTS = {
+    'already_secured_funds': sa.text("0"),
+    'currency': sa.text("'INR'"),
+    'visibility': sa.text("'private'"),
+    'project_stage': sa.text("'planning'"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column_name, server_default in DRAFT_SERVER_DEFAULTS.items():
+        op.alter_column('perdix_mp_project_drafts', column_name, server_default=server_default)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column_name in DRAFT_SERVER_DEFAULTS:
+        op.alter_column('perdix_mp_project_drafts', column_name, server_default=None)
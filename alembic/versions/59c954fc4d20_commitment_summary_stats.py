@@ -0,0 +1,212 @@
+"""extend project commitment stats for the commitments summary
+
+Revision ID: 59c954fc4d20
+Revises: 017537b0fbae
+Create Date: 2026-10-17 09:14:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '59c954fc4d20'
+down_revision: Union[str, Sequence[str], None] = '017537b0fbae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Per-status counts, the amount under review and the latest commitment
+    # date, so the commitments summary reads one row per project instead of
+    # grouping every commitment
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('commitment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('under_review_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('rejected_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('withdrawn_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('under_review_amount', sa.Numeric(), server_default='0', nullable=False))
+    op.add_column('perdix_mp_project_commitment_stats', sa.Column('latest_commitment_at', postgresql.TIMESTAMP(timezone=True), nullable=True))
+    op.create_index(
+        'ix_project_commitment_stats_latest',
+        'perdix_mp_project_commitment_stats',
+        [sa.text('latest_commitment_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('commitment_count > 0'),
+    )
+
+    # The trigger now tracks every commitment, not only approved ones, so it
+    # is replaced together with its delta function
+    op.execute("DROP TRIGGER IF EXISTS perdix_mp_commitments_stats ON perdix_mp_commitments;")
+    op.execute("DROP FUNCTION IF EXISTS perdix_mp_commitments_stats();")
+    op.execute("DROP FUNCTION IF EXISTS perdix_mp_apply_commitment_stats_delta(varchar, integer, numeric);")
+
+    # As before, deltas are applied with ON CONFLICT ... SET x = x + delta.
+    # latest_commitment_at only moves forward here (greatest() skips NULLs);
+    # the trigger recomputes it when a commitment leaves a project.
+    op.execute("""
+        CREATE FUNCTION perdix_mp_apply_commitment_stats_delta(
+            p_project_id varchar, p_sign integer, p_status varchar,
+            p_interest_rate numeric, p_amount numeric, p_created_at timestamptz
+        ) RETURNS void AS $$
+            INSERT INTO perdix_mp_project_commitment_stats AS s
+                (project_id, approved_count, interest_rate_sum, interest_rate_count,
+                 commitment_count, under_review_count, rejected_count, withdrawn_count,
+                 under_review_amount, latest_commitment_at, updated_at)
+            VALUES (
+                p_project_id,
+                CASE WHEN p_status = 'approved' THEN p_sign ELSE 0 END,
+                CASE WHEN p_status = 'approved' THEN p_sign * coalesce(p_interest_rate, 0) ELSE 0 END,
+                CASE WHEN p_status = 'approved' AND p_interest_rate IS NOT NULL THEN p_sign ELSE 0 END,
+                p_sign,
+                CASE WHEN p_status = 'under_review' THEN p_sign ELSE 0 END,
+                CASE WHEN p_status = 'rejected' THEN p_sign ELSE 0 END,
+                CASE WHEN p_status = 'withdrawn' THEN p_sign ELSE 0 END,
+                CASE WHEN p_status = 'under_review' THEN p_sign * coalesce(p_amount, 0) ELSE 0 END,
+                CASE WHEN p_sign > 0 THEN p_created_at END,
+                now()
+            )
+            ON CONFLICT (project_id) DO UPDATE SET
+                approved_count = s.approved_count + EXCLUDED.approved_count,
+                interest_rate_sum = s.interest_rate_sum + EXCLUDED.interest_rate_sum,
+                interest_rate_count = s.interest_rate_count + EXCLUDED.interest_rate_count,
+                commitment_count = s.commitment_count + EXCLUDED.commitment_count,
+                under_review_count = s.under_review_count + EXCLUDED.under_review_count,
+                rejected_count = s.rejected_count + EXCLUDED.rejected_count,
+                withdrawn_count = s.withdrawn_count + EXCLUDED.withdrawn_count,
+                under_review_amount = s.under_review_amount + EXCLUDED.under_review_amount,
+                latest_commitment_at = greatest(s.latest_commitment_at, EXCLUDED.latest_commitment_at),
+                updated_at = EXCLUDED.updated_at;
+        $$ LANGUAGE sql;
+    """)
+    op.execute("""
+        CREATE FUNCTION perdix_mp_commitments_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(
+                    OLD.project_id, -1, OLD.status, OLD.interest_rate, OLD.amount, OLD.created_at
+                );
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(
+                    NEW.project_id, 1, NEW.status, NEW.interest_rate, NEW.amount, NEW.created_at
+                );
+            END IF;
+            -- A commitment left OLD.project_id: its latest date may have gone with it
+            IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.project_id IS DISTINCT FROM OLD.project_id) THEN
+                UPDATE perdix_mp_project_commitment_stats
+                SET latest_commitment_at = (
+                    SELECT max(created_at) FROM perdix_mp_commitments WHERE project_id = OLD.project_id
+                )
+                WHERE project_id = OLD.project_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    # Commitments removed by a project delete cascade run at trigger depth 1;
+    # the stats row is cascaded away with the project, so they are skipped
+    op.execute("""
+        CREATE TRIGGER perdix_mp_commitments_stats
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, status, interest_rate, amount
+        ON perdix_mp_commitments
+        FOR EACH ROW
+        WHEN (pg_trigger_depth() = 0)
+        EXECUTE FUNCTION perdix_mp_commitments_stats();
+    """)
+
+    # Rebuild every stats row from the commitments. CREATE TRIGGER holds a lock
+    # that blocks commitment writes until this migration commits, so nothing
+    # is counted twice or missed.
+    op.execute("""
+        INSERT INTO perdix_mp_project_commitment_stats AS s
+            (project_id, approved_count, interest_rate_sum, interest_rate_count,
+             commitment_count, under_review_count, rejected_count, withdrawn_count,
+             under_review_amount, latest_commitment_at)
+        SELECT
+            project_id,
+            count(*) FILTER (WHERE status = 'approved'),
+            coalesce(sum(interest_rate) FILTER (WHERE status = 'approved'), 0),
+            count(interest_rate) FILTER (WHERE status = 'approved'),
+            count(*),
+            count(*) FILTER (WHERE status = 'under_review'),
+            count(*) FILTER (WHERE status = 'rejected'),
+            count(*) FILTER (WHERE status = 'withdrawn'),
+            coalesce(sum(amount) FILTER (WHERE status = 'under_review'), 0),
+            max(created_at)
+        FROM perdix_mp_commitments
+        GROUP BY project_id
+        ON CONFLICT (project_id) DO UPDATE SET
+            approved_count = EXCLUDED.approved_count,
+            interest_rate_sum = EXCLUDED.interest_rate_sum,
+            interest_rate_count = EXCLUDED.interest_rate_count,
+            commitment_count = EXCLUDED.commitment_count,
+            under_review_count = EXCLUDED.under_review_count,
+            rejected_count = EXCLUDED.rejected_count,
+            withdrawn_count = EXCLUDED.withdrawn_count,
+            under_review_amount = EXCLUDED.under_review_amount,
+            latest_commitment_at = EXCLUDED.latest_commitment_at,
+            updated_at = now();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Back to the approved-only trigger of revision 5e8c797dd8bd
+    op.execute("DROP TRIGGER IF EXISTS perdix_mp_commitments_stats ON perdix_mp_commitments;")
+    op.execute("DROP FUNCTION IF EXISTS perdix_mp_commitments_stats();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS perdix_mp_apply_commitment_stats_delta("
+        "varchar, integer, varchar, numeric, numeric, timestamptz);"
+    )
+    op.execute("""
+        CREATE FUNCTION perdix_mp_apply_commitment_stats_delta(
+            p_project_id varchar, p_sign integer, p_interest_rate numeric
+        ) RETURNS void AS $$
+            INSERT INTO perdix_mp_project_commitment_stats AS s
+                (project_id, approved_count, interest_rate_sum, interest_rate_count, updated_at)
+            VALUES (
+                p_project_id,
+                p_sign,
+                p_sign * coalesce(p_interest_rate, 0),
+                CASE WHEN p_interest_rate IS NULL THEN 0 ELSE p_sign END,
+                now()
+            )
+            ON CONFLICT (project_id) DO UPDATE SET
+                approved_count = s.approved_count + EXCLUDED.approved_count,
+                interest_rate_sum = s.interest_rate_sum + EXCLUDED.interest_rate_sum,
+                interest_rate_count = s.interest_rate_count + EXCLUDED.interest_rate_count,
+                updated_at = EXCLUDED.updated_at;
+        $$ LANGUAGE sql;
+    """)
+    op.execute("""
+        CREATE FUNCTION perdix_mp_commitments_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'approved' THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(OLD.project_id, -1, OLD.interest_rate);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'approved' THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(NEW.project_id, 1, NEW.interest_rate);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER perdix_mp_commitments_stats
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, status, interest_rate
+        ON perdix_mp_commitments
+        FOR EACH ROW
+        WHEN (pg_trigger_depth() = 0)
+        EXECUTE FUNCTION perdix_mp_commitments_stats();
+    """)
+    op.drop_index('ix_project_commitment_stats_latest', table_name='perdix_mp_project_commitment_stats')
+    op.drop_column('perdix_mp_project_commitment_stats', 'latest_commitment_at')
+    op.drop_column('perdix_mp_project_commitment_stats', 'under_review_amount')
+    op.drop_column('perdix_mp_project_commitment_stats', 'withdrawn_count')
+    op.drop_column('perdix_mp_project_commitment_stats', 'rejected_count')
+    op.drop_column('perdix_mp_project_commitment_stats', 'under_review_count')
+    op.drop_column('perdix_mp_project_commitment_stats', 'commitment_count')
@@ -0,0 +1,100 @@
+"""add trigger-maintained project commitment stats
+
+Revision ID: 5e8c797dd8bd
+Revises: 25862ca894ae
+Create Date: 2026-10-17 09:08:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8c797dd8bd'
+down_revision: Union[str, Sequence[str], None] = '25862ca894ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'perdix_mp_project_commitment_stats',
+        sa.Column('project_id', sa.String(length=255), nullable=False),
+        sa.Column('approved_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('interest_rate_sum', sa.Numeric(), server_default='0', nullable=False),
+        sa.Column('interest_rate_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['perdix_mp_projects.project_reference_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id'),
+    )
+
+    # Each row change removes the old row's contribution and adds the new one's.
+    # Deltas are applied with ON CONFLICT ... SET x = x + delta, so concurrent
+    # writers on the same project never overwrite each other's updates.
+    op.execute("""
+        CREATE FUNCTION perdix_mp_apply_commitment_stats_delta(
+            p_project_id varchar, p_sign integer, p_interest_rate numeric
+        ) RETURNS void AS $$
+            INSERT INTO perdix_mp_project_commitment_stats AS s
+                (project_id, approved_count, interest_rate_sum, interest_rate_count, updated_at)
+            VALUES (
+                p_project_id,
+                p_sign,
+                p_sign * coalesce(p_interest_rate, 0),
+                CASE WHEN p_interest_rate IS NULL THEN 0 ELSE p_sign END,
+                now()
+            )
+            ON CONFLICT (project_id) DO UPDATE SET
+                approved_count = s.approved_count + EXCLUDED.approved_count,
+                interest_rate_sum = s.interest_rate_sum + EXCLUDED.interest_rate_sum,
+                interest_rate_count = s.interest_rate_count + EXCLUDED.interest_rate_count,
+                updated_at = EXCLUDED.updated_at;
+        $$ LANGUAGE sql;
+    """)
+    op.execute("""
+        CREATE FUNCTION perdix_mp_commitments_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'approved' THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(OLD.project_id, -1, OLD.interest_rate);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'approved' THEN
+                PERFORM perdix_mp_apply_commitment_stats_delta(NEW.project_id, 1, NEW.interest_rate);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    # Commitments removed by a project delete cascade run at trigger depth 1;
+    # the stats row is cascaded away with the project, so they are skipped
+    op.execute("""
+        CREATE TRIGGER perdix_mp_commitments_stats
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, status, interest_rate
+        ON perdix_mp_commitments
+        FOR EACH ROW
+        WHEN (pg_trigger_depth() = 0)
+        EXECUTE FUNCTION perdix_mp_commitments_stats();
+    """)
+
+    # Backfill from existing approved commitments. CREATE TRIGGER holds a lock
+    # that blocks commitment writes until this migration commits, so nothing
+    # is counted twice or missed.
+    op.execute("""
+        INSERT INTO perdix_mp_project_commitment_stats
+            (project_id, approved_count, interest_rate_sum, interest_rate_count)
+        SELECT project_id, count(*), coalesce(sum(interest_rate), 0), count(interest_rate)
+        FROM perdix_mp_commitments
+        WHERE status = 'approved'
+        GROUP BY project_id;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS perdix_mp_commitments_stats ON perdix_mp_commitments;")
+    op.execute("DROP FUNCTION IF EXISTS perdix_mp_commitments_stats();")
+    op.execute("DROP FUNCTION IF EXISTS perdix_mp_apply_commitment_stats_delta(varchar, integer, numeric);")
+    op.drop_table('perdix_mp_project_commitment_stats')
@@ -0,0 +1,77 @@
+"""add project filter and search indexes
+
+Revision ID: 709719654a8b
+Revises: 7cc9d541b32d
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '709719654a8b'
+down_revision: Union[str, Sequence[str], None] = '7cc9d541b32d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, columns, extra options) on perdix_mp_projects; the equality
+# filters of the project listing, each followed by its created_at ordering
+INDEXES = [
+    (
+        'ix_projects_organization_id_created_at',
+        ['organization_id', sa.text('created_at DESC')],
+        {},
+    ),
+    (
+        'ix_projects_state_created_at',
+        ['state', sa.text('created_at DESC')],
+        {},
+    ),
+    (
+        'ix_projects_category_created_at',
+        ['category', sa.text('created_at DESC')],
+        {},
+    ),
+    # Substring search (ILIKE '%term%') on project_reference_id
+    (
+        'ix_projects_reference_id_trgm',
+        ['project_reference_id'],
+        {
+            'postgresql_using': 'gin',
+            'postgresql_ops': {'project_reference_id': 'gin_trgm_ops'},
+        },
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so the projects table stays writable during the build
+    with op.get_context().autocommit_block():
+        for index_name, columns, options in INDEXES:
+            op.create_index(
+                index_name,
+                'perdix_mp_projects',
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                **options,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in reversed(INDEXES):
+            op.drop_index(
+                index_name,
+                table_name='perdix_mp_projects',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
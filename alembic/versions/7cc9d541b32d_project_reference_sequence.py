@@ -0,0 +1,44 @@
+"""add project reference id sequence
+
+Revision ID: 7cc9d541b32d
+Revises: 5e8c797dd8bd
+Create Date: 2026-10-17 09:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7cc9d541b32d'
+down_revision: Union[str, Sequence[str], None] = '5e8c797dd8bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('perdix_mp_project_reference_seq')))
+    # Continue after the highest number already issued (projects or drafts),
+    # so generated IDs never collide with existing PROJ-YYYY-NNNNN values
+    op.execute(r"""
+        SELECT setval(
+            'perdix_mp_project_reference_seq',
+            greatest(coalesce(max(number), 0), 1),
+            max(number) IS NOT NULL
+        )
+        FROM (
+            SELECT substring(project_reference_id FROM '^PROJ-[0-9]{4}-([0-9]+)$')::bigint AS number
+            FROM perdix_mp_projects
+            UNION ALL
+            SELECT substring(project_reference_id FROM '^PROJ-[0-9]{4}-([0-9]+)$')::bigint
+            FROM perdix_mp_project_drafts
+        ) AS issued
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence('perdix_mp_project_reference_seq')))
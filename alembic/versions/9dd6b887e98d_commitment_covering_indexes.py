@@ -0,0 +1,44 @@
+"""add commitment covering indexes
+
+Revision ID: 9dd6b887e98d
+Revises: 0bd51924c8d8
+Create Date: 2026-10-17 09:06:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9dd6b887e98d'
+down_revision: Union[str, Sequence[str], None] = '0bd51924c8d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the commitments table stays writable during the build
+    with op.get_context().autocommit_block():
+        # Latest commitment per project for one lender (DISTINCT ON project_id)
+        op.create_index(
+            'ix_commitments_committed_by_project',
+            'perdix_mp_commitments',
+            ['committed_by', 'project_id', sa.text('created_at DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_commitments_committed_by_project',
+            table_name='perdix_mp_commitments',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
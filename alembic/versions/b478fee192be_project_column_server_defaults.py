@@ -0,0 +1,41 @@
+"""add server defaults to project columns
+
+Revision ID: b478fee192be
+Revises: insert_menu_data
+Create Date: 2026-10-17 09:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b478fee192be'
+down_revision: Union[str, Sequence[str], None] = 'insert_menu_data'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Column -> server default applied by the database on INSERT
+PROJECT_SERVER_DEFAULTS = {
+    'already_secured_funds': sa.text("0"),
+    'funding_raised': sa.text("0"),
+    'currency': sa.text("'INR'"),
+    'status': sa.text("'draft'"),
+    'visibility': sa.text("'private'"),
+    'project_stage': sa.text("'planning'"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column_name, server_default in PROJECT_SERVER_DEFAULTS.items():
+        op.alter_column('perdix_mp_projects', column_name, server_default=server_default)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column_name in PROJECT_SERVER_DEFAULTS:
+        op.alter_column('perdix_mp_projects', column_name, server_default=None)
@@ -0,0 +1,45 @@
+"""add question listing index
+
+Revision ID: b80760ccae72
+Revises: 59c954fc4d20
+Create Date: 2026-10-17 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b80760ccae72'
+down_revision: Union[str, Sequence[str], None] = '59c954fc4d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the questions table stays writable during the build
+    with op.get_context().autocommit_block():
+        # Newest-first question listing per project, for both offset pages and
+        # the (created_at, id) keyset cursor
+        op.create_index(
+            'ix_questions_project_created_at_id',
+            'perdix_mp_questions',
+            ['project_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_questions_project_created_at_id',
+            table_name='perdix_mp_questions',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
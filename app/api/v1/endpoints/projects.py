@@ -14,7 +14,6 @@ from app.schemas.project import (
     ProjectRejectRequest,
     ProjectResubmitRequest,
     FullyFundedProjectListResponse,
-    FullyFundedProjectResponse,
 )
 from app.services.project_service import ProjectService
 from app.services.project_document_service import ProjectDocumentService
@@ -81,7 +80,6 @@ def upload_project_file(
             from app.services.project_service import ProjectService
             project_service = ProjectService(db)
             project_reference_id = project_service._generate_project_reference_id()
-            project_service._validate_project_reference_id_unique(project_reference_id)
             logger.info(f"Generated project_reference_id for file upload: {project_reference_id}")
         
         project_document = service.upload_project_file(
@@ -278,27 +276,18 @@ def get_fully_funded_projects(
     Only projects with status 'funding_completed' are returned.
     Funding parameters are calculated from commitments with status 'approved'.
     """
-    try:
-        service = ProjectService(db)
-        projects, total = service.get_fully_funded_projects(
-            skip=skip,
-            limit=limit
-        )
-        # Convert SQLAlchemy models to Pydantic schemas
-        projects_response = [FullyFundedProjectResponse.model_validate(project) for project in projects]
-        return {
-            "status": "success",
-            "message": "Fully funded projects fetched successfully",
-            "data": projects_response,
-            "total": total
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch fully funded projects: {str(e)}"
-        )
+    service = ProjectService(db)
+    projects, total = service.get_fully_funded_projects(
+        skip=skip,
+        limit=limit
+    )
+    # The service already returns FullyFundedProjectResponse items
+    return {
+        "status": "success",
+        "message": "Fully funded projects fetched successfully",
+        "data": projects,
+        "total": total
+    }
 
 
 @router.get("/funded-by-user", response_model=ProjectListResponse, status_code=status.HTTP_200_OK)
@@ -306,6 +295,7 @@ def get_projects_funded_by_user(
     committed_by: str = Query(..., description="User ID who has made commitments to projects"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor; when set, skip is ignored"),
     db: Session = Depends(get_db)
 ):
     """
@@ -320,35 +310,32 @@ def get_projects_funded_by_user(
     commitment status) made by the user, attached under the 'commitment' field.
     
     Projects are returned ordered by most recent first (created_at desc).
+    For deep pagination pass the returned `next_cursor` as `after` instead of increasing `skip`.
     """
-    try:
-        service = ProjectService(db)
-        projects, total = service.get_projects_funded_by_user(
-            committed_by=committed_by,
-            skip=skip,
-            limit=limit
-        )
-        # Convert SQLAlchemy models to Pydantic schemas
-        # ProjectResponse schema already supports commitment field
-        projects_response = [ProjectResponse.model_validate(project) for project in projects]
-        return {
-            "status": "success",
-            "message": f"Projects funded by user {committed_by} fetched successfully",
-            "data": projects_response,
-            "total": total
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch projects funded by user: {str(e)}"
-        )
+    service = ProjectService(db)
+    projects, total, next_cursor = service.get_projects_funded_by_user(
+        committed_by=committed_by,
+        skip=skip,
+        limit=limit,
+        after=after,
+    )
+    # The service already returns ProjectResponse items (with the commitment field)
+    return {
+        "status": "success",
+        "message": f"Projects funded by user {committed_by} fetched successfully",
+        "data": projects,
+        "total": total,
+        "next_cursor": next_cursor
+    }
 
 
 @router.get("/states", response_model=dict, status_code=status.HTTP_200_OK)
 def get_distinct_states(db: Session = Depends(get_db)):
-    """Get all distinct states from projects table, ordered alphabetically."""
+    """Get all distinct states from projects table, ordered alphabetically.
+    
+    Cached per worker for PROJECT_LOOKUP_CACHE_TTL seconds (default 30); a project
+    change handled by another worker can take that long to show up here.
+    """
     try:
         service = ProjectService(db)
         states = service.get_distinct_states()
@@ -368,7 +355,11 @@ def get_distinct_states(db: Session = Depends(get_db)):
 
 @router.get("/value-ranges", response_model=dict, status_code=status.HTTP_200_OK)
 def get_value_ranges(db: Session = Depends(get_db)):
-    """Get min and max ranges for funding_requirement and commitment_gap fields."""
+    """Get min and max ranges for funding_requirement and commitment_gap fields.
+    
+    Cached per worker for PROJECT_LOOKUP_CACHE_TTL seconds (default 30); a project
+    change handled by another worker can take that long to show up here.
+    """
     try:
         service = ProjectService(db)
         ranges = service.get_value_ranges()
@@ -388,7 +379,11 @@ def get_value_ranges(db: Session = Depends(get_db)):
 
 @router.get("/municipality-credit-ratings", response_model=dict, status_code=status.HTTP_200_OK)
 def get_distinct_municipality_credit_ratings(db: Session = Depends(get_db)):
-    """Get all distinct municipality_credit_rating values from projects table, ordered alphabetically."""
+    """Get all distinct municipality_credit_rating values from projects table, ordered alphabetically.
+    
+    Cached per worker for PROJECT_LOOKUP_CACHE_TTL seconds (default 30); a project
+    change handled by another worker can take that long to show up here.
+    """
     try:
         service = ProjectService(db)
         ratings = service.get_distinct_municipality_credit_ratings()
@@ -429,8 +424,7 @@ def get_project(
                 "data": project_data
             }
         else:
-            project = service.get_project_by_id(project_id)
-            project_response = ProjectResponse.model_validate(project)
+            project_response = service.get_project_response(project_id)
             return {
                 "status": "success",
                 "message": "Project fetched successfully",
@@ -487,6 +481,12 @@ def get_project_by_reference(
                 "message": "Project fetched successfully",
                 "data": project_data,
             }
+        elif not committed_by:
+            return {
+                "status": "success",
+                "message": "Project fetched successfully",
+                "data": service.get_project_response_by_reference_id(project_reference_id),
+            }
         else:
             project, commitment = service.get_project_with_commitment_by_reference(
                 project_reference_id=project_reference_id,
@@ -535,13 +535,22 @@ def get_projects(
     max_commitment_gap: Optional[Decimal] = Query(None, description="Maximum commitment gap (in rupees)"),
     min_total_project_cost: Optional[Decimal] = Query(None, description="Minimum project cost (in rupees)"),
     max_total_project_cost: Optional[Decimal] = Query(None, description="Maximum project cost (in rupees)"),
+    include_total: bool = Query(False, description="Include the total count of matching projects (returned as null when false)"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor; when set, skip is ignored"),
     db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
-    """Get list of projects with optional filters and pagination. Projects are returned ordered by most recent first (created_at desc)."""
+    """Get list of projects with optional filters and pagination. Projects are returned ordered by most recent first (created_at desc).
+
+    `total` is only computed when `include_total=true`; otherwise it is returned as null.
+    For unfiltered listings the total is the database's row estimate for the projects table.
+
+    For deep pagination pass the returned `next_cursor` as `after` instead of increasing `skip`;
+    `next_cursor` is null on the last page.
+    """
     try:
         service = ProjectService(db)
-        projects, total = service.get_projects(
+        projects, total, next_cursor = service.get_projects(
             skip=skip,
             limit=limit,
             organization_id=organization_id,
@@ -562,15 +571,17 @@ def get_projects(
             min_commitment_gap=min_commitment_gap,
             max_commitment_gap=max_commitment_gap,
             min_total_project_cost=min_total_project_cost,
-            max_total_project_cost=max_total_project_cost
+            max_total_project_cost=max_total_project_cost,
+            include_total=include_total,
+            after=after
         )
-        # Convert SQLAlchemy models to Pydantic schemas
-        projects_response = [ProjectResponse.model_validate(project) for project in projects]
+        # The service already returns ProjectResponse items
         return {
             "status": "success",
             "message": "Projects fetched successfully",
-            "data": projects_response,
-            "total": total
+            "data": projects,
+            "total": total,
+            "next_cursor": next_cursor
         }
     except HTTPException:
         raise
@@ -69,6 +69,8 @@ def list_questions(
     priority: str | None = Query(None, description="Filter by priority"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of records"),
+    include_total: bool = Query(True, description="Include the total count of matching questions (returned as null when false)"),
+    after: str | None = Query(None, description="Cursor from the previous page's next_cursor; when set, skip is ignored"),
     current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -77,6 +79,11 @@ def list_questions(
     
     Can filter by project_id (project_reference_id) and/or organization_id.
     At least one of project_id or organization_id should be provided.
+    
+    Pass `include_total=false` (e.g. for "load more" lists) to skip counting;
+    `has_more` tells whether another page follows either way.
+    For deep pagination pass the returned `next_cursor` as `after` instead of
+    increasing `skip`; `next_cursor` is null on the last page.
     """
     # Validate that at least one filter is provided
     if not project_id and not organization_id:
@@ -87,7 +94,7 @@ def list_questions(
     
     try:
         service = QuestionService(db)
-        questions, total = service.list_questions(
+        questions, total, has_more, next_cursor = service.list_questions(
             project_id=project_id,
             organization_id=organization_id,
             status_filter=status_filter,
@@ -95,6 +102,8 @@ def list_questions(
             priority=priority,
             skip=skip,
             limit=limit,
+            include_total=include_total,
+            after=after,
         )
         questions_response = [
             QuestionResponse.model_validate(question) for question in questions
@@ -104,6 +113,8 @@ def list_questions(
             "message": "Questions fetched successfully",
             "data": questions_response,
             "total": total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
     except HTTPException:
         raise
@@ -36,6 +36,17 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "root"
     POSTGRES_DB: str = "munify_db"
     SQL_ECHO: bool = False  # SQLAlchemy echo setting
+    DB_POOL_SIZE: int = 20  # Persistent connections kept in the pool
+    DB_MAX_OVERFLOW: int = 20  # Extra connections allowed during bursts
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is recycled
+    STRICT_LOADING: bool = False  # Raise on unplanned lazy loads in list endpoints (dev/test)
+    
+    # In-process caches
+    FULLY_FUNDED_CACHE_TTL: int = 5  # Seconds a fully funded projects page is cached (per worker)
+    PROJECT_CACHE_TTL: int = 5  # Seconds a single project read is cached
+    PROJECT_CACHE_MAXSIZE: int = 1024  # Projects kept in the single-project read cache
+    PROJECT_LOOKUP_CACHE_TTL: int = 30  # Seconds filter lookups (states, ratings, value ranges) are cached (per worker)
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080","http://localhost:5173"]
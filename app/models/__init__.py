@@ -18,6 +18,7 @@ from app.models.project_document import ProjectDocument
 from app.models.commitment import Commitment
 from app.models.commitment_history import CommitmentHistory
 from app.models.commitment_document import CommitmentDocument
+from app.models.project_commitment_stats import ProjectCommitmentStats
 from app.models.project_note import ProjectNote
 from app.models.perdix_user_detail import PerdixUserDetail
 from app.models.perdix_file import PerdixFile
@@ -45,6 +46,7 @@ __all__ = [
     "Commitment",
     "CommitmentHistory",
     "CommitmentDocument",
+    "ProjectCommitmentStats",
     "Question",
     "QuestionReply",
     "QuestionReplyDocument",
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Integer,
     CheckConstraint,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.sql import func
@@ -73,16 +74,20 @@ class Commitment(Base):
     updated_by = Column(String(255), nullable=True)
 
     # Relationships
+    # lazy="raise": use the project_id column instead of crossing the relationship
     project = relationship(
         "Project",
         foreign_keys=[project_id],
         primaryjoin="Commitment.project_id == Project.project_reference_id",
         viewonly=True,
+        lazy="raise",
     )
     history = relationship(
         "CommitmentHistory",
         back_populates="commitment",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
     __table_args__ = (
@@ -94,6 +99,29 @@ class Commitment(Base):
             "status IN ('under_review', 'approved', 'rejected', 'withdrawn', 'funded', 'completed')",
             name="check_commitment_status",
         ),
+        # Latest commitment by a given lender for a project
+        Index(
+            "ix_commitments_project_committer_created_at",
+            "project_id",
+            "committed_by",
+            created_at.desc(),
+        ),
+        # Latest commitment per project for one lender (funded-by-user listing)
+        Index(
+            "ix_commitments_committed_by_project",
+            "committed_by",
+            "project_id",
+            created_at.desc(),
+        ),
+        # Covers the per-project best-deal lookup of the commitments summary
+        # (project_id + status filter, amount/rate/mode read index-only)
+        Index(
+            "ix_commitments_summary",
+            "project_id",
+            "status",
+            created_at.desc(),
+            postgresql_include=["amount", "interest_rate", "funding_mode"],
+        ),
     )
 
 
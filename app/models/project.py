@@ -1,10 +1,14 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, Integer, CheckConstraint
+from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, Integer, CheckConstraint, FetchedValue, Index, Sequence, text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 
+# Numeric part of PROJ-YYYY-NNNNN reference IDs, shared by projects and drafts
+project_reference_seq = Sequence("perdix_mp_project_reference_seq", metadata=Base.metadata)
+
+
 class Project(Base):
     __tablename__ = "perdix_mp_projects"
     
@@ -25,7 +29,7 @@ class Project(Base):
     
     # Project Overview
     category = Column(String(100), nullable=True)  # Infrastructure, Sanitation, Water Supply, Transportation, Renewable Energy
-    project_stage = Column(String(50), default='planning', nullable=True)
+    project_stage = Column(String(50), default='planning', server_default=text("'planning'"), nullable=True)
     description = Column(Text, nullable=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
@@ -43,9 +47,9 @@ class Project(Base):
     # Financial Information
     total_project_cost = Column(Numeric(15, 2), nullable=True)
     funding_requirement = Column(Numeric(15, 2), nullable=False)
-    already_secured_funds = Column(Numeric(15, 2), default=0, nullable=True)
-    commitment_gap = Column(Numeric(15, 2), nullable=True)  # Generated column - read-only
-    currency = Column(String(10), default='INR', nullable=True)
+    already_secured_funds = Column(Numeric(15, 2), default=0, server_default=text("0"), nullable=True)
+    commitment_gap = Column(Numeric(15, 2), server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=True)  # Generated column - read-only
+    currency = Column(String(10), default='INR', server_default=text("'INR'"), nullable=True)
     tenure = Column(Integer, nullable=True)  # Tenure in years
     cut_off_rate_percentage = Column(Numeric(5, 2), nullable=True)  # Cut-off rate percentage
     minimum_commitment_amount = Column(Numeric(15, 2), nullable=True)  # Minimum commitment amount
@@ -60,12 +64,12 @@ class Project(Base):
     municipality_credit_score = Column(Numeric(5, 2), nullable=True)
     
     # Status & Workflow
-    status = Column(String(50), default='draft', nullable=True)
-    visibility = Column(String(50), default='private', nullable=True)
+    status = Column(String(50), default='draft', server_default=text("'draft'"), nullable=True)
+    visibility = Column(String(50), default='private', server_default=text("'private'"), nullable=True)
     
     # Calculated Fields
-    funding_raised = Column(Numeric(15, 2), default=0, nullable=True)
-    funding_percentage = Column(Numeric(5, 2), nullable=True)  # Generated column - read-only
+    funding_raised = Column(Numeric(15, 2), default=0, server_default=text("0"), nullable=True)
+    funding_percentage = Column(Numeric(5, 2), server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=True)  # Generated column - read-only
     
     # Source & Audit
     approved_at = Column(TIMESTAMP(timezone=True), nullable=True)
@@ -79,7 +83,29 @@ class Project(Base):
     updated_by = Column(String(255), nullable=True)
     
     # Relationships
-    rejection_history = relationship("ProjectRejectionHistory", back_populates="project", cascade="all, delete-orphan")
+    # lazy="raise": serializers must not trigger per-row lazy loads; rows are
+    # removed by the ON DELETE CASCADE foreign key (passive_deletes)
+    rejection_history = relationship(
+        "ProjectRejectionHistory",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    # A single commitment for this project, populated only by queries that join a
+    # specific commitment in with contains_eager (e.g. the user's latest one).
+    # Never lazy-loaded.
+    commitment = relationship(
+        "Commitment",
+        primaryjoin="Project.project_reference_id == foreign(Commitment.project_id)",
+        uselist=False,
+        viewonly=True,
+        lazy="noload",
+    )
+    
+    # Fetch server-generated values (id, timestamps, generated columns) in the
+    # INSERT/UPDATE's RETURNING clause instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Add check constraints
     __table_args__ = (
@@ -89,5 +115,39 @@ class Project(Base):
             name="check_status"
         ),
         CheckConstraint("visibility IN ('private', 'public')", name="check_visibility"),
+        # Newest-first listing, with and without a status filter
+        Index("ix_projects_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_projects_status_created_at", "status", created_at.desc()),
+        # Equality filters of the listing, in listing order
+        Index("ix_projects_organization_id_created_at", "organization_id", created_at.desc()),
+        Index("ix_projects_state_created_at", "state", created_at.desc()),
+        Index("ix_projects_category_created_at", "category", created_at.desc()),
+        # Substring search on project_reference_id (requires pg_trgm)
+        Index(
+            "ix_projects_reference_id_trgm",
+            "project_reference_id",
+            postgresql_using="gin",
+            postgresql_ops={"project_reference_id": "gin_trgm_ops"},
+        ),
+        # Fully funded listing
+        Index(
+            "ix_projects_funded_created_at_id",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("status = 'funding_completed'"),
+        ),
+        # Distinct trimmed values for the state / credit rating filter lookups
+        Index(
+            "ix_projects_state_trim",
+            func.trim(state),
+            postgresql_where=text("state IS NOT NULL AND trim(state) <> ''"),
+        ),
+        Index(
+            "ix_projects_credit_rating_trim",
+            func.trim(municipality_credit_rating),
+            postgresql_where=text(
+                "municipality_credit_rating IS NOT NULL AND trim(municipality_credit_rating) <> ''"
+            ),
+        ),
     )
 
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, String, Numeric, Integer, ForeignKey, Index, text
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from app.core.database import Base
+
+
+class ProjectCommitmentStats(Base):
+    """
+    Per-project commitment aggregates: totals for the commitments summary and
+    the approved-commitment figures of the fully funded listing.
+
+    Maintained by the perdix_mp_commitments_stats trigger (see the
+    project_commitment_stats migration); the application only reads it.
+    Sums and counts are stored instead of the average so every commitment
+    write applies a commutative delta.
+    """
+    __tablename__ = "perdix_mp_project_commitment_stats"
+    
+    # Foreign key to project (references project_reference_id)
+    project_id = Column(String(255), ForeignKey("perdix_mp_projects.project_reference_id", ondelete="CASCADE"), primary_key=True)
+    
+    # Approved commitments (investors)
+    approved_count = Column(Integer, nullable=False, server_default="0")
+    # Sum and count of interest_rate over approved commitments that have one
+    interest_rate_sum = Column(Numeric, nullable=False, server_default="0")
+    interest_rate_count = Column(Integer, nullable=False, server_default="0")
+    
+    # All commitments, by status, for the commitments summary
+    commitment_count = Column(Integer, nullable=False, server_default="0")
+    under_review_count = Column(Integer, nullable=False, server_default="0")
+    rejected_count = Column(Integer, nullable=False, server_default="0")
+    withdrawn_count = Column(Integer, nullable=False, server_default="0")
+    under_review_amount = Column(Numeric, nullable=False, server_default="0")
+    latest_commitment_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        # Commitments summary, newest activity first
+        Index(
+            "ix_project_commitment_stats_latest",
+            latest_commitment_at.desc(),
+            postgresql_where=text("commitment_count > 0"),
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, Integer, CheckConstraint
+from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, Integer, CheckConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from app.core.database import Base
@@ -25,7 +25,7 @@ class ProjectDraft(Base):
     
     # Project Overview
     category = Column(String(100), nullable=True)
-    project_stage = Column(String(50), default='planning', nullable=True)
+    project_stage = Column(String(50), default='planning', server_default=text("'planning'"), nullable=True)
     description = Column(Text, nullable=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
@@ -43,9 +43,9 @@ class ProjectDraft(Base):
     # Financial Information
     total_project_cost = Column(Numeric(15, 2), nullable=True)
     funding_requirement = Column(Numeric(15, 2), nullable=True)  # Nullable for drafts
-    already_secured_funds = Column(Numeric(15, 2), default=0, nullable=True)
+    already_secured_funds = Column(Numeric(15, 2), default=0, server_default=text("0"), nullable=True)
     commitment_gap = Column(Numeric(15, 2), nullable=True)
-    currency = Column(String(10), default='INR', nullable=True)
+    currency = Column(String(10), default='INR', server_default=text("'INR'"), nullable=True)
     tenure = Column(Integer, nullable=True)  # Tenure in years
     cut_off_rate_percentage = Column(Numeric(5, 2), nullable=True)  # Cut-off rate percentage
     minimum_commitment_amount = Column(Numeric(15, 2), nullable=True)  # Minimum commitment amount
@@ -60,7 +60,7 @@ class ProjectDraft(Base):
     municipality_credit_score = Column(Numeric(5, 2), nullable=True)
     
     # Status & Workflow (for draft tracking)
-    visibility = Column(String(50), default='private', nullable=True)
+    visibility = Column(String(50), default='private', server_default=text("'private'"), nullable=True)
     
     # Source & Audit
     approved_by = Column(String(255), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Text, Integer, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, Integer, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import relationship
@@ -26,4 +26,8 @@ class ProjectRejectionHistory(Base):
     
     # Relationship
     project = relationship("Project", back_populates="rejection_history")
-
+    
+    # Latest rejection per project (resubmit flow)
+    __table_args__ = (
+        Index("ix_rejection_history_project_rejected_at", "project_id", rejected_at.desc()),
+    )
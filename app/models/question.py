@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Text, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -40,6 +40,19 @@ class Question(Base):
         cascade="all, delete-orphan",
     )
 
+    # Fetch server-generated values (id, timestamps) in the INSERT/UPDATE's
+    # RETURNING clause instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Newest-first listing of a project's questions (offset and keyset pages)
+        Index("ix_questions_project_created_at_id", "project_id", created_at.desc(), id.desc()),
+        Index(
+            "ix_questions_project_status_created_at_id",
+            "project_id", "status", created_at.desc(), id.desc(),
+        ),
+    )
+
 
 class QuestionReply(Base):
     """
@@ -70,4 +83,6 @@ class QuestionReply(Base):
         cascade="all, delete-orphan",
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
 
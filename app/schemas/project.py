@@ -165,7 +165,8 @@ class ProjectListResponse(BaseModel):
     status: str
     message: str
     data: list[ProjectResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
     
     model_config = ConfigDict(from_attributes=True)
 
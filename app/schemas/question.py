@@ -76,7 +76,9 @@ class QuestionListResponse(BaseModel):
     status: str
     message: str
     data: List[QuestionResponse]
-    total: int
+    total: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
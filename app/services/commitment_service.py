@@ -1,6 +1,5 @@
 from typing import Tuple, List
 from decimal import Decimal
-from datetime import datetime
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -15,6 +14,7 @@ from app.schemas.commitment import (
     CommitmentUpdate,
 )
 from app.services.commitment_document_service import CommitmentDocumentService
+from app.services.project_service import invalidate_project_caches
 from app.schemas.commitment import CommitmentResponse
 
 
@@ -290,7 +290,6 @@ class CommitmentService:
 
             # Increment update_count
             commitment.update_count = (commitment.update_count or 0) + 1
-            commitment.updated_at = datetime.now()
 
             self._create_history_snapshot(
                 commitment=commitment,
@@ -324,7 +323,6 @@ class CommitmentService:
 
             self._ensure_transition_allowed(commitment.status, "withdrawn")
             commitment.status = "withdrawn"
-            commitment.updated_at = datetime.now()
             if user_id:
                 commitment.updated_by = user_id
 
@@ -421,15 +419,13 @@ class CommitmentService:
             # Update commitment status
             commitment.status = "approved"
             commitment.approved_by = user_id
-            commitment.approved_at = datetime.now()
+            commitment.approved_at = func.now()
             if approval_notes:
                 commitment.rejection_notes = approval_notes
             commitment.updated_by = user_id
-            commitment.updated_at = datetime.now()
 
             # Update project funding_raised (sum of all approved commitments including this one)
             project.funding_raised = approved_commitments_total + commitment.amount
-            project.updated_at = datetime.now()
             project.updated_by = user_id
 
             self._create_history_snapshot(
@@ -439,6 +435,7 @@ class CommitmentService:
             )
 
             self.db.commit()
+            invalidate_project_caches()
             self.db.refresh(commitment)
 
             logger.info("Commitment %s approved successfully", commitment.id)
@@ -480,7 +477,6 @@ class CommitmentService:
             commitment.rejection_reason = rejection_reason
             commitment.rejection_notes = rejection_notes
             commitment.updated_by = user_id
-            commitment.updated_at = datetime.now()
 
             self._create_history_snapshot(
                 commitment=commitment,
@@ -521,7 +517,6 @@ class CommitmentService:
             commitment.status = "funded"
             if user_id:
                 commitment.updated_by = user_id
-            commitment.updated_at = datetime.now()
 
             self._create_history_snapshot(
                 commitment=commitment,
@@ -530,6 +525,7 @@ class CommitmentService:
             )
 
             self.db.commit()
+            invalidate_project_caches()
             self.db.refresh(commitment)
 
             logger.info("Commitment %s marked as funded", commitment.id)
@@ -562,7 +558,6 @@ class CommitmentService:
             commitment.status = "completed"
             if user_id:
                 commitment.updated_by = user_id
-            commitment.updated_at = datetime.now()
 
             self._create_history_snapshot(
                 commitment=commitment,
@@ -571,6 +566,7 @@ class CommitmentService:
             )
 
             self.db.commit()
+            invalidate_project_caches()
             self.db.refresh(commitment)
 
             logger.info("Commitment %s marked as completed", commitment.id)
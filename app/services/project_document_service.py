@@ -6,7 +6,7 @@ to projects via the perdix_mp_project_documents table.
 """
 from typing import Optional
 from fastapi import UploadFile, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager
 from datetime import datetime
 
 from app.models.project_document import ProjectDocument
@@ -342,9 +342,10 @@ class ProjectDocumentService:
             self._validate_document_type(document_type)
             query = query.filter(ProjectDocument.document_type == document_type)
         
-        # Eager load file relationship
+        # Populate the file relationship from the join above (no second join
+        # of perdix_mp_files, no per-document lazy load)
         documents = query.options(
-            joinedload(ProjectDocument.file)
+            contains_eager(ProjectDocument.file)
         ).order_by(ProjectDocument.created_at.desc()).all()
         
         return documents
@@ -1,15 +1,20 @@
 from typing import Tuple
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from fastapi import HTTPException, status
 from decimal import Decimal
-from datetime import datetime
 from pydantic import ValidationError
 from app.models.project_draft import ProjectDraft
 from app.schemas.project_draft import ProjectDraftCreate, ProjectDraftUpdate
 from app.core.logging import get_logger
 from app.services.project_service import ProjectService
-from app.services.project_service import ProjectService
+from app.services.project_service import (
+    INVALID_STAGE_DETAIL,
+    INVALID_VISIBILITY_DETAIL,
+    VALID_STAGES,
+    VALID_VISIBILITIES,
+)
 logger = get_logger("services.project_draft")
 
 
@@ -105,20 +110,18 @@ class ProjectDraftService:
     
     def _validate_project_stage(self, stage: str):
         """Validate project stage"""
-        valid_stages = ['planning', 'initiated', 'in_progress']
-        if stage and stage not in valid_stages:
+        if stage and stage not in VALID_STAGES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid project stage. Must be one of: {', '.join(valid_stages)}"
+                detail=INVALID_STAGE_DETAIL
             )
     
     def _validate_visibility(self, visibility: str):
         """Validate project visibility"""
-        valid_visibilities = ['private', 'public']
-        if visibility and visibility not in valid_visibilities:
+        if visibility and visibility not in VALID_VISIBILITIES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid visibility. Must be one of: {', '.join(valid_visibilities)}"
+                detail=INVALID_VISIBILITY_DETAIL
             )
     
     def create_draft(self, draft_data: ProjectDraftCreate, user_id: str = None) -> ProjectDraft:
@@ -133,17 +136,12 @@ class ProjectDraftService:
                 self._validate_visibility(draft_data.visibility)
             
             # Create draft dict
-            draft_dict = draft_data.model_dump(exclude_unset=True)
-            
-            # Set defaults
-            if 'already_secured_funds' not in draft_dict or draft_dict['already_secured_funds'] is None:
-                draft_dict['already_secured_funds'] = Decimal('0')
-            # Currency is always set by backend (ignore frontend value)
-            draft_dict['currency'] = 'INR'
-            if 'visibility' not in draft_dict or draft_dict['visibility'] is None:
-                draft_dict['visibility'] = 'private'
-            if 'project_stage' not in draft_dict or draft_dict['project_stage'] is None:
-                draft_dict['project_stage'] = 'planning'
+            # Explicit nulls are dropped so column defaults (visibility, project_stage,
+            # already_secured_funds) are applied by the model/DB
+            draft_dict = draft_data.model_dump(exclude_unset=True, exclude_none=True)
+            # Currency is always set by backend (ignore frontend value): the
+            # column default is 'INR'
+            draft_dict.pop('currency', None)
             
             # Set user tracking
             if user_id:
@@ -152,11 +150,8 @@ class ProjectDraftService:
             
             # Generate project_reference_id if not provided
             if 'project_reference_id' not in draft_dict or not draft_dict.get('project_reference_id'):
+                # Sequence-backed, so no uniqueness check is needed
                 draft_dict['project_reference_id'] = self._generate_project_reference_id()
-                # Validate uniqueness
-                
-                project_service = ProjectService(self.db)
-                project_service._validate_project_reference_id_unique(draft_dict['project_reference_id'])
                 logger.info(f"Generated project_reference_id for draft: {draft_dict['project_reference_id']}")
             
             # Create draft
@@ -341,7 +336,7 @@ class ProjectDraftService:
             # Update user tracking
             if user_id:
                 draft.updated_by = user_id
-            draft.updated_at = datetime.now()
+            draft.updated_at = func.now()
             
             # Recalculate completion percentage
             draft.completion_percentage = self._calculate_completion_percentage(draft)
@@ -1,18 +1,152 @@
 from typing import Tuple, Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, aliased, contains_eager
+from sqlalchemy import and_, bindparam, delete, func, case, insert, literal_column, null, or_, select, text, true, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from decimal import Decimal
-from datetime import datetime
-from app.models.project import Project
+from datetime import datetime, timezone
+from app.models.project import Project, project_reference_seq
 from app.models.project_favorite import ProjectFavorite
 from app.models.project_rejection_history import ProjectRejectionHistory
 from app.models.commitment import Commitment
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.models.project_commitment_stats import ProjectCommitmentStats
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, FullyFundedProjectResponse
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.models.project_draft import ProjectDraft
+from app.utils.cache import TTLCache
+from app.utils.pagination import decode_cursor, encode_cursor
 logger = get_logger("services.project")
 
+PROJECT_STATUSES = ('draft', 'pending_validation', 'active', 'funding_completed', 'closed', 'rejected')
+PROJECT_STAGES = ('planning', 'initiated', 'in_progress')
+PROJECT_VISIBILITIES = ('private', 'public')
+
+VALID_STATUSES = frozenset(PROJECT_STATUSES)
+VALID_STAGES = frozenset(PROJECT_STAGES)
+VALID_VISIBILITIES = frozenset(PROJECT_VISIBILITIES)
+
+# Validation error details, built once at import
+INVALID_STATUS_DETAIL = f"Invalid status. Must be one of: {', '.join(PROJECT_STATUSES)}"
+INVALID_STAGE_DETAIL = f"Invalid project stage. Must be one of: {', '.join(PROJECT_STAGES)}"
+INVALID_VISIBILITY_DETAIL = f"Invalid visibility. Must be one of: {', '.join(PROJECT_VISIBILITIES)}"
+
+# Workflow transitions: approve -> 'active', reject -> 'rejected',
+# resubmit -> 'pending_validation'
+ALLOWED_TRANSITIONS = {
+    'draft': frozenset({'rejected'}),
+    'pending_validation': frozenset({'active', 'rejected'}),
+    'active': frozenset(),
+    'funding_completed': frozenset({'rejected'}),
+    'closed': frozenset({'rejected'}),
+    'rejected': frozenset({'pending_validation'}),
+}
+
+# Statuses a project can be rejected from
+REJECTABLE_STATUSES = tuple(
+    current for current, targets in ALLOWED_TRANSITIONS.items() if 'rejected' in targets
+)
+
+# Statuses a project can be resubmitted (moved to 'pending_validation') from
+RESUBMITTABLE_STATUSES = tuple(
+    current for current, targets in ALLOWED_TRANSITIONS.items() if 'pending_validation' in targets
+)
+
+# Conflict messages for specific (current_status, new_status) pairs
+TRANSITION_CONFLICTS = {
+    ('active', 'active'): "Project is already approved and active",
+    ('rejected', 'rejected'): "Project is already rejected",
+    ('active', 'rejected'): "Cannot reject an active project",
+}
+
+# Fallback conflict messages per new_status
+TRANSITION_DEFAULT_CONFLICTS = {
+    'active': "Cannot approve a project with status '{status}'. Project must be in 'pending_validation' status.",
+    'pending_validation': "Cannot resubmit project with status '{status}'. Project must be in 'rejected' status.",
+}
+
+# Commitment statuses that count towards a project: every live commitment, and
+# the subset whose amount is committed (approved or later)
+ACTIVE_COMMITMENT_STATUSES = ('under_review', 'approved', 'funded', 'completed')
+COMMITTED_COMMITMENT_STATUSES = ('approved', 'funded', 'completed')
+
+# SQLSTATE of a unique constraint / unique index violation
+UNIQUE_VIOLATION = '23505'
+
+# OFFSET beyond which get_projects logs a hint to switch to keyset pagination
+DEEP_OFFSET_WARNING = 1000
+
+# Validates a whole listing page in one call instead of one model_validate per row
+PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+
+
+# Rendered inline rather than bound, so the planner can match the partial
+# index on status = 'funding_completed' even under a generic prepared plan
+FUNDING_COMPLETED = literal_column("'funding_completed'")
+
+
+def _fully_funded_projects_stmt():
+    """Page of 'funding_completed' projects with their funding parameters.
+
+    ``skip`` and ``limit`` are bound parameters, so the statement is built once
+    and its compiled form is reused from the engine's compiled cache.
+    """
+    # Page of projects with status 'funding_completed', most recent first
+    projects_table = Project.__table__
+    page = (
+        select(projects_table)
+        .where(projects_table.c.status == FUNDING_COMPLETED)
+        .order_by(projects_table.c.created_at.desc(), projects_table.c.id.desc())
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+        .subquery("page")
+    )
+    
+    # Funding parameters from the trigger-maintained stats row, per project on
+    # the page. The average only counts commitments with an interest_rate;
+    # projects without approved commitments have no row (0 investors).
+    stats = ProjectCommitmentStats.__table__
+    average_interest_rate = func.round(
+        stats.c.interest_rate_sum / func.nullif(stats.c.interest_rate_count, 0), 2
+    )
+    
+    # Core select returning plain row mappings: no ORM identity map or
+    # attribute instrumentation for a read-only listing
+    return (
+        select(
+            page,
+            average_interest_rate.label("average_interest_rate"),
+            func.coalesce(stats.c.approved_count, 0).label("number_of_investors"),
+        )
+        .select_from(page.outerjoin(stats, stats.c.project_id == page.c.project_reference_id))
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    )
+
+FULLY_FUNDED_COUNT_STMT = (
+    select(func.count(Project.id))
+    .where(Project.status == FUNDING_COMPLETED)
+)
+FULLY_FUNDED_PROJECTS_STMT = _fully_funded_projects_stmt()
+
+# Fully funded listing pages by (skip, limit); cleared by writes that can change
+# a funding_completed project or its approved commitments
+fully_funded_cache = TTLCache("fully_funded_projects", settings.FULLY_FUNDED_CACHE_TTL)
+
+# Single-project reads (ProjectResponse) by ID or reference ID; cleared by any
+# project write
+project_cache = TTLCache("projects", settings.PROJECT_CACHE_TTL, maxsize=settings.PROJECT_CACHE_MAXSIZE)
+
+# Filter reference data (distinct states, credit ratings, value ranges); each is
+# a full scan of the projects table
+lookup_cache = TTLCache("project_lookups", settings.PROJECT_LOOKUP_CACHE_TTL)
+
+
+def invalidate_project_caches() -> None:
+    """Drop cached project reads, fully funded pages and filter lookups after a committed write"""
+    project_cache.clear()
+    fully_funded_cache.clear()
+    lookup_cache.clear()
 
 class ProjectService:
     def __init__(self, db: Session):
@@ -20,29 +154,24 @@ class ProjectService:
     
     def _generate_project_reference_id(self) -> str:
         """Generate unique project reference ID: PROJ-YYYY-XXXXX
-        Counts both projects and drafts to ensure uniqueness across both tables.
+        The number comes from a sequence shared by projects and drafts, so
+        concurrent creates never get the same ID.
         """
-       
-        
-        current_year = datetime.now().year
-        
-        # Count projects created this year
-        project_count = self.db.query(func.count(Project.id)).filter(
-            func.extract('year', Project.created_at) == current_year
-        ).scalar() or 0
-        
-        # Count drafts created this year (with project_reference_id)
-        draft_count = self.db.query(func.count(ProjectDraft.id)).filter(
-            ProjectDraft.project_reference_id.isnot(None),
-            func.extract('year', ProjectDraft.created_at) == current_year
-        ).scalar() or 0
+        # The year comes from the database clock in the same round-trip
+        number, year = self.db.execute(
+            select(project_reference_seq.next_value(), func.to_char(func.now(), 'YYYY'))
+        ).one()
         
-        # Total count = projects + drafts
-        total_count = project_count + draft_count
-        
-        # Format: PROJ-YYYY-XXXXX (5 digits, zero-padded)
-        sequence = str(total_count + 1).zfill(5)
-        return f"PROJ-{current_year}-{sequence}"
+        # Format: PROJ-YYYY-XXXXX (at least 5 digits, zero-padded)
+        return f"PROJ-{year}-{number:05d}"
+    
+    def _generate_project_reference_ids(self, count: int) -> List[str]:
+        """Generate `count` project reference IDs with one sequence round-trip"""
+        rows = self.db.execute(
+            select(project_reference_seq.next_value(), func.to_char(func.now(), 'YYYY'))
+            .select_from(func.generate_series(1, count))
+        ).all()
+        return [f"PROJ-{year}-{number:05d}" for number, year in rows]
     
     def _validate_project_reference_id_unique(
         self, 
@@ -53,57 +182,127 @@ class ProjectService:
         """Validate that project_reference_id is unique across both projects and drafts"""
         
         
-        # Check in projects table
-        query = self.db.query(Project).filter(Project.project_reference_id == project_reference_id)
+        # Check in projects table (EXISTS, so no row is loaded)
+        query = self.db.query(Project.id).filter(Project.project_reference_id == project_reference_id)
         if exclude_id:
             query = query.filter(Project.id != exclude_id)
-        existing_project = query.first()
         
-        if existing_project:
+        if self.db.query(query.exists()).scalar():
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Project reference ID '{project_reference_id}' already exists in projects"
             )
         
         # Check in drafts table
-        draft_query = self.db.query(ProjectDraft).filter(ProjectDraft.project_reference_id == project_reference_id)
+        draft_query = self.db.query(ProjectDraft.id).filter(ProjectDraft.project_reference_id == project_reference_id)
         if exclude_draft_id:
             draft_query = draft_query.filter(ProjectDraft.id != exclude_draft_id)
-        existing_draft = draft_query.first()
         
-        if existing_draft:
+        if self.db.query(draft_query.exists()).scalar():
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Project reference ID '{project_reference_id}' already exists in drafts"
             )
     
+    def _get_current_status(self, project_id: int) -> Optional[str]:
+        """Return a project's current status (NULL allowed); 404 if the project does not exist"""
+        row = self.db.query(Project.status).filter(Project.id == project_id).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with ID {project_id} not found"
+            )
+        return row.status
+    
+    def _ensure_transition_allowed(self, current_status: str, new_status: str):
+        """Raise 409 if the workflow does not allow moving from current_status to new_status"""
+        if new_status in ALLOWED_TRANSITIONS.get(current_status, frozenset()):
+            return
+        detail = TRANSITION_CONFLICTS.get((current_status, new_status))
+        if detail is None:
+            detail = TRANSITION_DEFAULT_CONFLICTS[new_status].format(status=current_status)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail
+        )
+    
     def _validate_status(self, status_value: str):
         """Validate project status"""
-        valid_statuses = ['draft', 'pending_validation', 'active', 'funding_completed', 'closed', 'rejected']
-        if status_value and status_value not in valid_statuses:
+        if status_value and status_value not in VALID_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+                detail=INVALID_STATUS_DETAIL
             )
     
     def _validate_project_stage(self, stage: str):
         """Validate project stage"""
-        valid_stages = ['planning', 'initiated', 'in_progress']
-        if stage and stage not in valid_stages:
+        if stage and stage not in VALID_STAGES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid project stage. Must be one of: {', '.join(valid_stages)}"
+                detail=INVALID_STAGE_DETAIL
             )
     
     def _validate_visibility(self, visibility: str):
         """Validate project visibility"""
-        valid_visibilities = ['private', 'public']
-        if visibility and visibility not in valid_visibilities:
+        if visibility and visibility not in VALID_VISIBILITIES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid visibility. Must be one of: {', '.join(valid_visibilities)}"
+                detail=INVALID_VISIBILITY_DETAIL
             )
     
+    def _validate_project_create(self, project_data: ProjectCreate):
+        """Validate status, stage, and visibility of a new project"""
+        self._validate_status(project_data.status)
+        self._validate_project_stage(project_data.project_stage)
+        self._validate_visibility(project_data.visibility)
+    
+    def _build_project_values(self, project_data: ProjectCreate, project_reference_id: str, user_id: Optional[str] = None, approved_at=None) -> dict:
+        """Build the column values for a new project row (shared by single and bulk create)
+        
+        approved_at defaults to the database clock; bulk inserts pass a plain
+        timestamp because executemany parameters cannot carry SQL expressions.
+        """
+        if approved_at is None:
+            approved_at = func.now()
+        
+        # Explicit nulls are dropped so column defaults (status, visibility,
+        # project_stage, funding amounts) are applied by the model/DB
+        project_dict = project_data.model_dump(exclude_unset=True, exclude_none=True)
+        project_dict['project_reference_id'] = project_reference_id
+        
+        # Set user tracking from auth context
+        if user_id:
+            project_dict['created_by'] = user_id
+            # Remove created_by from request data if it was provided (should come from auth)
+            project_dict.pop('created_by', None)
+            project_dict['created_by'] = user_id
+        
+        # Currency is always set by backend (ignore frontend value)
+        project_dict['currency'] = 'INR'
+
+        # Check if admin is creating project - auto-approve if so
+        is_admin = project_dict.get('organization_type', '').lower() == 'munify'
+
+        if 'status' not in project_dict:
+            # Admin-created projects are auto-approved (status='active')
+            # Municipality-created projects fall back to the 'draft' column default
+            if is_admin:
+                project_dict['status'] = 'active'
+                # Set approval fields for admin-created projects
+                if user_id:
+                    project_dict['approved_by'] = user_id
+                project_dict['approved_at'] = approved_at
+                logger.info("Admin-created project will be auto-approved with status='active'")
+        elif is_admin and project_dict.get('status') == 'pending_validation':
+            # If admin explicitly sets pending_validation, auto-approve it
+            project_dict['status'] = 'active'
+            if user_id:
+                project_dict['approved_by'] = user_id
+            project_dict['approved_at'] = approved_at
+            logger.info("Admin-created project with pending_validation status will be auto-approved")
+
+        return project_dict
+    
     def create_project(self, project_data: ProjectCreate, project_reference_id: Optional[str] = None, user_id: Optional[str] = None) -> Project:
         """Create a new project
         
@@ -112,103 +311,107 @@ class ProjectService:
             project_reference_id: Optional existing project_reference_id (from draft). 
                                  If provided, uses this ID instead of generating a new one.
         """
-        logger.info(f"Creating project: {project_data.title}")
+        logger.info("Creating project: %s", project_data.title)
+        
+        # Validate before the session touches the database, so a bad request
+        # costs neither a sequence value nor a ROLLBACK round-trip
+        self._validate_project_create(project_data)
         
         try:
-            # Validate status, stage, and visibility
-            self._validate_status(project_data.status)
-            self._validate_project_stage(project_data.project_stage)
-            self._validate_visibility(project_data.visibility)
-            
             # Use existing project_reference_id if provided, otherwise generate new one
             if project_reference_id:
                 # When project_reference_id is provided, it comes from a draft submission.
-                # We only need to check if it exists in projects table (not drafts, 
-                # because it MUST exist in the draft being submitted).
-                existing_project = self.db.query(Project).filter(
-                    Project.project_reference_id == project_reference_id
-                ).first()
-                
-                if existing_project:
-                    raise HTTPException(
-                        status_code=status.HTTP_409_CONFLICT,
-                        detail=f"Project reference ID '{project_reference_id}' already exists in projects"
-                    )
-                
+                # A project already using it is caught by the unique index on insert
+                # (see the IntegrityError handler below), not by a pre-check SELECT.
                 final_project_reference_id = project_reference_id
-                logger.info(f"Using existing project_reference_id: {final_project_reference_id}")
+                logger.info("Using existing project_reference_id: %s", final_project_reference_id)
             else:
                 # Generate new project reference ID
                 final_project_reference_id = self._generate_project_reference_id()
-                self._validate_project_reference_id_unique(final_project_reference_id)
-                logger.info(f"Generated new project_reference_id: {final_project_reference_id}")
+                logger.info("Generated new project_reference_id: %s", final_project_reference_id)
             
             # Create project
-            project_dict = project_data.model_dump(exclude_unset=True)
-            project_dict['project_reference_id'] = final_project_reference_id
-            
-            # Set user tracking from auth context
-            if user_id:
-                project_dict['created_by'] = user_id
-                # Remove created_by from request data if it was provided (should come from auth)
-                project_dict.pop('created_by', None)
-                project_dict['created_by'] = user_id
-            
-            # Set defaults
-            if 'already_secured_funds' not in project_dict or project_dict['already_secured_funds'] is None:
-                project_dict['already_secured_funds'] = Decimal('0')
-            # Currency is always set by backend (ignore frontend value)
-            project_dict['currency'] = 'INR'
-            
-            # Check if admin is creating project - auto-approve if so
-            is_admin = project_dict.get('organization_type', '').lower() == 'munify'
-            
-            if 'status' not in project_dict or project_dict['status'] is None:
-                # Admin-created projects are auto-approved (status='active')
-                # Municipality-created projects default to 'draft' (or 'pending_validation' if from draft submission)
-                if is_admin:
-                    project_dict['status'] = 'active'
-                    # Set approval fields for admin-created projects
-                    if user_id:
-                        project_dict['approved_by'] = user_id
-                    project_dict['approved_at'] = datetime.now()
-                    logger.info(f"Admin-created project will be auto-approved with status='active'")
-                else:
-                    project_dict['status'] = 'draft'
-            elif is_admin and project_dict.get('status') == 'pending_validation':
-                # If admin explicitly sets pending_validation, auto-approve it
-                project_dict['status'] = 'active'
-                if user_id:
-                    project_dict['approved_by'] = user_id
-                project_dict['approved_at'] = datetime.now()
-                logger.info(f"Admin-created project with pending_validation status will be auto-approved")
-            
-            if 'visibility' not in project_dict or project_dict['visibility'] is None:
-                project_dict['visibility'] = 'private'
-            if 'project_stage' not in project_dict or project_dict['project_stage'] is None:
-                project_dict['project_stage'] = 'planning'
-            if 'funding_raised' not in project_dict or project_dict['funding_raised'] is None:
-                project_dict['funding_raised'] = Decimal('0')
-            
+            project_dict = self._build_project_values(project_data, final_project_reference_id, user_id)
             project = Project(**project_dict)
             self.db.add(project)
             self.db.commit()
-            self.db.refresh(project)
+            invalidate_project_caches()
             
-            logger.info(f"Project {project.id} created successfully with reference ID: {project.project_reference_id}, status: {project.status}")
+            logger.info("Project %s created successfully with reference ID: %s, status: %s", project.id, project.project_reference_id, project.status)
             return project
             
         except HTTPException:
             self.db.rollback()
             raise
+        except IntegrityError as e:
+            self.db.rollback()
+            # project_reference_id is the only unique column set by the request
+            if getattr(e.orig, "sqlstate", None) == UNIQUE_VIOLATION:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Project reference ID '{final_project_reference_id}' already exists in projects"
+                )
+            raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error creating project: {str(e)}")
+            logger.error("Error creating project: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create project: {str(e)}"
             )
     
+    def create_projects_bulk(self, projects_data: List[ProjectCreate], user_id: Optional[str] = None) -> List[Project]:
+        """Create several projects in one transaction
+        
+        Reference IDs are preallocated from the sequence in a single query and
+        the rows go out as one executemany INSERT ... RETURNING, instead of a
+        sequence call, INSERT and refresh per project.
+        """
+        if not projects_data:
+            return []
+        
+        logger.info("Creating %s projects in bulk", len(projects_data))
+        
+        for project_data in projects_data:
+            self._validate_project_create(project_data)
+        
+        try:
+            reference_ids = self._generate_project_reference_ids(len(projects_data))
+            approved_at = datetime.now(timezone.utc)
+            rows = [
+                self._build_project_values(project_data, reference_id, user_id, approved_at)
+                for project_data, reference_id in zip(projects_data, reference_ids)
+            ]
+            
+            projects = self.db.scalars(
+                insert(Project).returning(Project, sort_by_parameter_order=True),
+                rows
+            ).all()
+            self.db.commit()
+            invalidate_project_caches()
+            
+            logger.info("Created %s projects in bulk", len(projects))
+            return projects
+            
+        except HTTPException:
+            self.db.rollback()
+            raise
+        except IntegrityError as e:
+            self.db.rollback()
+            if getattr(e.orig, "sqlstate", None) == UNIQUE_VIOLATION:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="One of the project reference IDs already exists in projects"
+                )
+            raise
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error creating projects in bulk: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create projects: {str(e)}"
+            )
+    
     def get_project_by_id(self, project_id: int) -> Project:
         """Get project by ID"""
         project = self.db.query(Project).filter(Project.id == project_id).first()
@@ -229,6 +432,24 @@ class ProjectService:
             )
         return project
     
+    def get_project_response(self, project_id: int) -> ProjectResponse:
+        """Read-only ProjectResponse by ID, served from the short-lived project cache.
+
+        Callers must not modify the returned item (it is shared); write paths keep
+        using get_project_by_id. Missing projects (404) are not cached.
+        """
+        return project_cache.get_or_set(
+            ("id", project_id),
+            lambda: ProjectResponse.model_validate(self.get_project_by_id(project_id)),
+        )
+    
+    def get_project_response_by_reference_id(self, project_reference_id: str) -> ProjectResponse:
+        """Read-only ProjectResponse by reference ID (see get_project_response)"""
+        return project_cache.get_or_set(
+            ("reference_id", project_reference_id),
+            lambda: ProjectResponse.model_validate(self.get_project_by_reference_id(project_reference_id)),
+        )
+    
     def get_project_with_documents(self, project_id: int = None, project_reference_id: str = None) -> dict:
         """
         Get project by ID or reference ID with associated documents and file details.
@@ -306,7 +527,6 @@ class ProjectService:
                 documents_data.append(doc_dict)
         
         # Convert project to dict using schema (includes all fields)
-        from app.schemas.project import ProjectResponse
         project_dict = ProjectResponse.model_validate(project).model_dump()
         # Add documents with file details to the project dict
         project_dict["documents"] = documents_data
@@ -332,13 +552,12 @@ class ProjectService:
 
         commitment: Optional[Commitment] = None
         if committed_by:
-            valid_statuses = ["under_review", "approved", "funded", "completed"]
             commitment = (
                 self.db.query(Commitment)
                 .filter(
                     Commitment.project_id == project_reference_id,
                     Commitment.committed_by == committed_by,
-                    Commitment.status.in_(valid_statuses),
+                    Commitment.status.in_(ACTIVE_COMMITMENT_STATUSES),
                 )
                 .order_by(Commitment.created_at.desc())
                 .first()
@@ -370,8 +589,18 @@ class ProjectService:
         max_commitment_gap: Decimal = None,
         min_total_project_cost: Decimal = None,
         max_total_project_cost: Decimal = None,
-    ) -> Tuple[list[Project], int]:
-        """Get list of projects with optional filters, ordered by most recent first"""
+        include_total: bool = False,
+        after: Optional[str] = None,
+    ) -> Tuple[List[ProjectResponse], Optional[int], Optional[str]]:
+        """Get list of projects with optional filters, ordered by most recent first.
+
+        The total count is only computed when include_total is True (None otherwise).
+        For unfiltered listings the total is the planner's row estimate for the table.
+
+        Pages are fetched by keyset when ``after`` (the next_cursor of the previous
+        page) is given; ``skip`` is then ignored. Returns (items, total, next_cursor),
+        where next_cursor is None on the last page.
+        """
         query = self.db.query(Project)
         
         # Validate status if provided
@@ -438,107 +667,139 @@ class ProjectService:
         if max_total_project_cost is not None:
             query = query.filter(Project.total_project_cost <= max_total_project_cost)
         
-        # Get total count before pagination
-        total = query.count()
+        # Total is opt-in: an exact count scans every row matching the filters
+        total = None
+        count_with_page = False
+        if include_total:
+            if query.whereclause is None:
+                # No filters applied - use pg_class.reltuples instead of counting the table
+                total = self.db.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+                    {"table_name": Project.__tablename__},
+                ).scalar()
+            if not total or total < 0:
+                # Filtered query, or table not analyzed yet (reltuples is 0 / -1).
+                # With OFFSET paging the count rides along with the page as a
+                # COUNT(*) OVER () window; a keyset cursor filters rows out of
+                # the window, so that case needs its own count.
+                if after:
+                    total = query.count()
+                else:
+                    count_query = query
+                    count_with_page = True
         
         # Apply ordering: most recent first (created_at DESC), then by id DESC for consistent ordering
-        projects = query.order_by(
+        query = query.order_by(
             Project.created_at.desc(),
             Project.id.desc()
-        ).offset(skip).limit(limit).all()
-
-        # Optimize: Calculate favorite counts, user favorites, and committed amounts in minimal queries
-        if projects:
-            project_ref_ids = [project.project_reference_id for project in projects]
-            
-            if project_ref_ids:
-                # Single query to get favorite counts for all projects
-                favorite_counts = self.db.query(
-                    ProjectFavorite.project_reference_id,
-                    func.count(ProjectFavorite.project_reference_id).label('count')
-                ).filter(
-                    ProjectFavorite.project_reference_id.in_(project_ref_ids)
-                ).group_by(ProjectFavorite.project_reference_id).all()
-                
-                # Create dictionary for O(1) lookup
-                favorite_count_dict = {ref_id: count for ref_id, count in favorite_counts}
-                
-                # Get user's favorites in a single query (only if user_id provided)
-                favorite_ref_set = set()
-                if user_id:
-                    user_favorites = self.db.query(ProjectFavorite.project_reference_id).filter(
-                        ProjectFavorite.user_id == user_id,
-                        ProjectFavorite.project_reference_id.in_(project_ref_ids)
-                    ).all()
-                    favorite_ref_set = {fav[0] for fav in user_favorites}
-                
-                # Single query to get total committed amounts for all projects
-                # Only count commitments with valid statuses: under_review, approved, funded, completed
-                valid_statuses = ["approved", "funded", "completed"]
-                committed_amounts = (
-                    self.db.query(
-                        Commitment.project_id,
-                        func.sum(Commitment.amount).label('total_amount')
-                    )
-                    .filter(
-                        Commitment.project_id.in_(project_ref_ids),
-                        Commitment.status.in_(valid_statuses)
-                    )
-                    .group_by(Commitment.project_id)
-                    .all()
-                )
-                
-                # Create dictionary for O(1) lookup
-                committed_amount_dict = {
-                    ref_id: total_amount for ref_id, total_amount in committed_amounts
-                }
-                
-                # Annotate all projects in a single loop
-                for project in projects:
-                    # Always set favorite_count (default to 0 if no favorites)
-                    setattr(project, "favorite_count", favorite_count_dict.get(project.project_reference_id, 0))
-                    
-                    # Set is_favorite only if user_id was provided
-                    if user_id:
-                        setattr(project, "is_favorite", project.project_reference_id in favorite_ref_set)
-                    
-                    # Set total_committed_amount (default to 0 if no commitments)
-                    total_committed = committed_amount_dict.get(project.project_reference_id, Decimal("0"))
-                    setattr(project, "total_committed_amount", total_committed)
-            else:
-                # Edge case: projects exist but no ref_ids (shouldn't happen, but handle gracefully)
-                for project in projects:
-                    setattr(project, "favorite_count", 0)
-                    setattr(project, "total_committed_amount", Decimal("0"))
-                    if user_id:
-                        setattr(project, "is_favorite", False)
+        )
+        
+        # Keyset: rows that sort after the cursor, read straight off the
+        # (created_at DESC, id DESC) index; OFFSET reads and discards skip rows
+        if after:
+            after_created_at, after_id = decode_cursor(after)
+            query = query.filter(
+                tuple_(Project.created_at, Project.id) < tuple_(after_created_at, after_id)
+            )
         else:
-            # No projects to annotate
-            pass
+            if skip > DEEP_OFFSET_WARNING:
+                logger.warning("Deep OFFSET pagination for projects (skip=%s); use the after cursor", skip)
+            query = query.offset(skip)
         
-        logger.info(f"Retrieved {len(projects)} projects (total: {total}) with filters: status={status}, organization_id={organization_id}, organization_type={organization_type}, visibility={visibility}")
+        if count_with_page:
+            query = query.add_columns(func.count().over().label("total_count"))
+        page = query.limit(limit).subquery("page")
+        page_project = aliased(Project, page)
         
-        return projects, total
+        # Favorite count, the user's favorite flag and the committed amount are
+        # correlated subqueries on the page rows, so projects and all three
+        # come back in one round-trip
+        favorite_count_sq = (
+            select(func.count())
+            .where(ProjectFavorite.project_reference_id == page_project.project_reference_id)
+            .scalar_subquery()
+        )
+        is_favorite_expr = (
+            select(ProjectFavorite.id)
+            .where(
+                ProjectFavorite.project_reference_id == page_project.project_reference_id,
+                ProjectFavorite.user_id == user_id
+            )
+            .exists()
+            if user_id
+            # NULL, i.e. is_favorite stays unset, when no user_id was provided
+            else null()
+        )
+        # Total committed amount (approved, funded, completed); 0 without commitments
+        committed_amount_sq = (
+            select(func.coalesce(func.sum(Commitment.amount), 0))
+            .where(
+                Commitment.project_id == page_project.project_reference_id,
+                Commitment.status.in_(COMMITTED_COMMITMENT_STATUSES)
+            )
+            .scalar_subquery()
+        )
+        columns = [
+            page_project,
+            favorite_count_sq.label("favorite_count"),
+            is_favorite_expr.label("is_favorite"),
+            committed_amount_sq.label("total_committed_amount"),
+        ]
+        if count_with_page:
+            columns.append(page.c.total_count)
+        rows = (
+            self.db.query(*columns)
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
+            .all()
+        )
+        if count_with_page:
+            if rows:
+                total = rows[0].total_count
+            else:
+                # Past the last row the window has nothing to count over
+                total = count_query.count() if skip else 0
+        
+        # Build response items instead of annotating the ORM instances, then release
+        # this page's instances from the session (this method is read-only)
+        items = PROJECT_LIST_ADAPTER.validate_python([row[0] for row in rows], from_attributes=True)
+        for item, row in zip(items, rows):
+            item.favorite_count = row.favorite_count
+            item.is_favorite = row.is_favorite
+            item.total_committed_amount = row.total_committed_amount
+            self.db.expunge(row[0])
+        
+        # A full page may have more rows after it
+        next_cursor = None
+        if len(items) == limit and items[-1].created_at is not None:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        
+        logger.info(
+            "Retrieved %s projects (total: %s) with filters: status=%s, organization_id=%s, organization_type=%s, visibility=%s",
+            len(items),
+            total,
+            status,
+            organization_id,
+            organization_type,
+            visibility,
+        )
+        
+        return items, total, next_cursor
     
     def update_project(self, project_id: int, project_data: ProjectUpdate, user_id: Optional[str] = None) -> Project:
-        """Update an existing project"""
-        logger.info(f"Updating project {project_id}")
-        
+        """Update an existing project using a single UPDATE ... RETURNING statement"""
+        logger.info("Updating project %s", project_id)
+
         try:
-            project = self.get_project_by_id(project_id)
-            
             # Validate status, stage, and visibility if provided
             update_dict = project_data.model_dump(exclude_unset=True)
-            
-            # Set user tracking from auth context
+
+            # Set user tracking from auth context (overrides updated_by from request data)
             if user_id:
-                project.updated_by = user_id
-                # Remove updated_by from request data if it was provided (should come from auth)
-                update_dict.pop('updated_by', None)
-            
+                update_dict['updated_by'] = user_id
+
             # Currency is backend-controlled - remove if frontend tries to change it
             if 'currency' in update_dict:
-                logger.warning(f"Attempted to update currency for project {project_id}. Currency is backend-controlled and will be ignored.")
+                logger.warning("Attempted to update currency for project %s. Currency is backend-controlled and will be ignored.", project_id)
                 del update_dict['currency']
             
             if 'status' in update_dict:
@@ -547,18 +808,25 @@ class ProjectService:
                 self._validate_project_stage(update_dict['project_stage'])
             if 'visibility' in update_dict:
                 self._validate_visibility(update_dict['visibility'])
-            
-            # Update fields
-            for field, value in update_dict.items():
-                setattr(project, field, value)
-            
-            # Update updated_at timestamp
-            project.updated_at = datetime.now()
-            
+
+            # Update fields and updated_at timestamp, returning the updated row
+            update_dict['updated_at'] = func.now()
+            project = self.db.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(**update_dict)
+                .returning(Project)
+            ).scalar_one_or_none()
+            if project is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project with ID {project_id} not found"
+                )
+
             self.db.commit()
-            self.db.refresh(project)
-            
-            logger.info(f"Project {project.id} updated successfully")
+            invalidate_project_caches()
+
+            logger.info("Project %s updated successfully", project.id)
             return project
             
         except HTTPException:
@@ -566,7 +834,7 @@ class ProjectService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error updating project {project_id}: {str(e)}")
+            logger.error("Error updating project %s: %s", project_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to update project: {str(e)}"
@@ -574,21 +842,30 @@ class ProjectService:
     
     def delete_project(self, project_id: int) -> None:
         """Delete a project"""
-        logger.info(f"Deleting project {project_id}")
+        logger.info("Deleting project %s", project_id)
         
         try:
-            project = self.get_project_by_id(project_id)
-            self.db.delete(project)
+            # Rejection history, favorites and commitments are removed by the
+            # ON DELETE CASCADE foreign keys
+            deleted_id = self.db.execute(
+                delete(Project).where(Project.id == project_id).returning(Project.id)
+            ).scalar_one_or_none()
+            if deleted_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project with ID {project_id} not found"
+                )
             self.db.commit()
+            invalidate_project_caches()
             
-            logger.info(f"Project {project_id} deleted successfully")
+            logger.info("Project %s deleted successfully", project_id)
             
         except HTTPException:
             self.db.rollback()
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error deleting project {project_id}: {str(e)}")
+            logger.error("Error deleting project %s: %s", project_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to delete project: {str(e)}"
@@ -596,36 +873,37 @@ class ProjectService:
     
     def approve_project(self, project_id: int, user_id: str, admin_notes: str = None) -> Project:
         """Approve a project - sets status to 'active'. Can approve projects in 'pending_validation' status (including resubmitted ones)."""
-        logger.info(f"Approving project {project_id} by {user_id}")
+        logger.info("Approving project %s by %s", project_id, user_id)
         
         try:
-            project = self.get_project_by_id(project_id)
+            # Update project status and approval fields; the status guard is part of
+            # the UPDATE so the check and the write cannot race
+            values = {
+                'status': 'active',
+                'approved_at': func.now(),
+                'approved_by': user_id,
+                'updated_at': func.now(),
+            }
+            if admin_notes:
+                values['admin_notes'] = admin_notes
             
-            # Check if project is already approved/active
-            if project.status == 'active':
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Project is already approved and active"
-                )
+            project = self.db.execute(
+                update(Project)
+                .where(Project.id == project_id, Project.status == 'pending_validation')
+                .values(**values)
+                .returning(Project)
+            ).scalar_one_or_none()
             
-            # Check if project is in a valid state for approval
-            if project.status not in ['pending_validation']:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Cannot approve a project with status '{project.status}'. Project must be in 'pending_validation' status."
-                )
-            
-            # Update project status and approval fields
-            project.status = 'active'
-            project.approved_at = datetime.now()
-            project.approved_by = user_id
-            if admin_notes:
-                project.admin_notes = admin_notes
+            if project is None:
+                # Nothing was updated: report a missing project (404) or a
+                # disallowed transition, including a NULL status (409)
+                current_status = self._get_current_status(project_id)
+                self._ensure_transition_allowed(current_status, 'active')
             
             self.db.commit()
-            self.db.refresh(project)
+            invalidate_project_caches()
             
-            logger.info(f"Project {project_id} approved successfully by {user_id}. Status set to 'active'")
+            logger.info("Project %s approved successfully by %s. Status set to 'active'", project_id, user_id)
             return project
             
         except HTTPException:
@@ -633,7 +911,7 @@ class ProjectService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error approving project {project_id}: {str(e)}")
+            logger.error("Error approving project %s: %s", project_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to approve project: {str(e)}"
@@ -641,25 +919,9 @@ class ProjectService:
     
     def reject_project(self, project_id: int, reject_note: str, user_id: str) -> Project:
         """Reject a project - sets status to 'rejected' and stores reject note"""
-        logger.info(f"Rejecting project {project_id} by {user_id}")
+        logger.info("Rejecting project %s by %s", project_id, user_id)
         
         try:
-            project = self.get_project_by_id(project_id)
-            
-            # Check if project is already rejected
-            if project.status == 'rejected':
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Project is already rejected"
-                )
-            
-            # Check if project is already active
-            if project.status == 'active':
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Cannot reject an active project"
-                )
-            
             # Validate reject note is not empty
             if not reject_note or not reject_note.strip():
                 raise HTTPException(
@@ -667,10 +929,29 @@ class ProjectService:
                     detail="Reject note is mandatory and cannot be empty"
                 )
             
-            # Update project status and reject note
-            project.status = 'rejected'
-            project.admin_notes = reject_note.strip()
-            project.approved_by = user_id
+            # Update project status and reject note; as in approve_project the
+            # status guard is part of the UPDATE. A project without a status
+            # can be rejected as well, as before the guard moved into SQL.
+            project = self.db.execute(
+                update(Project)
+                .where(
+                    Project.id == project_id,
+                    or_(Project.status.in_(REJECTABLE_STATUSES), Project.status.is_(None)),
+                )
+                .values(
+                    status='rejected',
+                    admin_notes=reject_note.strip(),
+                    approved_by=user_id,
+                    updated_at=func.now(),
+                )
+                .returning(Project)
+            ).scalar_one_or_none()
+            
+            if project is None:
+                # Nothing was updated: report a missing project (404) or a
+                # disallowed transition, e.g. active or already rejected (409)
+                current_status = self._get_current_status(project_id)
+                self._ensure_transition_allowed(current_status, 'rejected')
             
             # Create rejection history record
             rejection = ProjectRejectionHistory(
@@ -681,9 +962,9 @@ class ProjectService:
             self.db.add(rejection)
             
             self.db.commit()
-            self.db.refresh(project)
+            invalidate_project_caches()
             
-            logger.info(f"Project {project_id} rejected successfully by {user_id}. Status set to 'rejected' and rejection history created")
+            logger.info("Project %s rejected successfully by %s. Status set to 'rejected' and rejection history created", project_id, user_id)
             return project
             
         except HTTPException:
@@ -691,7 +972,7 @@ class ProjectService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error rejecting project {project_id}: {str(e)}")
+            logger.error("Error rejecting project %s: %s", project_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to reject project: {str(e)}"
@@ -699,29 +980,9 @@ class ProjectService:
     
     def resubmit_project(self, project_id: int, project_data, user_id: Optional[str] = None) -> Project:
         """Resubmit a rejected project - updates project fields and changes status from 'rejected' to 'pending_validation'"""
-        logger.info(f"Resubmitting project {project_id} by {user_id}")
+        logger.info("Resubmitting project %s by %s", project_id, user_id)
         
         try:
-            project = self.get_project_by_id(project_id)
-            
-            # Validate project is in rejected status
-            if project.status != 'rejected':
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Cannot resubmit project with status '{project.status}'. Project must be in 'rejected' status."
-                )
-            
-            # Get the latest rejection record for this project
-            latest_rejection = self.db.query(ProjectRejectionHistory).filter(
-                ProjectRejectionHistory.project_id == project_id
-            ).order_by(ProjectRejectionHistory.rejected_at.desc()).first()
-            
-            if not latest_rejection:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Rejection history not found for this project"
-                )
-            
             # Extract resubmission_notes before processing update_dict (it's not a project field)
             resubmission_notes = getattr(project_data, 'resubmission_notes', None)
             
@@ -730,13 +991,13 @@ class ProjectService:
             
             # Remove fields that shouldn't be updated via resubmission
             if 'currency' in update_dict:
-                logger.warning(f"Attempted to update currency for project {project_id}. Currency is backend-controlled and will be ignored.")
+                logger.warning("Attempted to update currency for project %s. Currency is backend-controlled and will be ignored.", project_id)
                 del update_dict['currency']
             if 'status' in update_dict:
-                logger.warning(f"Attempted to set status in resubmission for project {project_id}. Status will be set to 'pending_validation' automatically.")
+                logger.warning("Attempted to set status in resubmission for project %s. Status will be set to 'pending_validation' automatically.", project_id)
                 del update_dict['status']
             if 'project_reference_id' in update_dict:
-                logger.warning(f"Attempted to update project_reference_id for project {project_id}. This field is immutable.")
+                logger.warning("Attempted to update project_reference_id for project %s. This field is immutable.", project_id)
                 del update_dict['project_reference_id']
             
             # Validate stage and visibility if provided
@@ -745,49 +1006,76 @@ class ProjectService:
             if 'visibility' in update_dict:
                 self._validate_visibility(update_dict['visibility'])
             
-            # Preserve original rejection note in admin_notes
-            original_rejection_note = project.admin_notes or ""
-            
-            # Update project fields
-            for field, value in update_dict.items():
-                setattr(project, field, value)
-            
-            # Change status to pending_validation
-            project.status = 'pending_validation'
-            
-            # Set user tracking from auth context
+            # Set user tracking from auth context (overrides updated_by from request data)
             if user_id:
-                project.updated_by = user_id
-                # Remove updated_by from request data if it was provided (should come from auth)
-                update_dict.pop('updated_by', None)
-            
-            # Reset approval fields (since it's being resubmitted)
-            project.approved_at = None
-            # Keep approved_by for audit trail (shows who rejected it)
+                update_dict['updated_by'] = user_id
             
-            # Update admin_notes with resubmission info
-            resubmission_info = []
+            # Resubmission info appended to admin_notes
+            resubmitted_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             if resubmission_notes:
-                resubmission_info.append(f"[RESUBMITTED on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by {user_id}]: {resubmission_notes}")
-            else:
-                resubmission_info.append(f"[RESUBMITTED on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} by {user_id}]")
-            
-            # Preserve original rejection note and append resubmission info
-            if original_rejection_note:
-                project.admin_notes = f"{original_rejection_note}\n\n" + "\n".join(resubmission_info)
+                resubmission_info = f"[RESUBMITTED on {resubmitted_on} by {user_id}]: {resubmission_notes}"
             else:
-                project.admin_notes = "\n".join(resubmission_info)
-            
-            # updated_by is already set above from user_id
-            project.updated_at = datetime.now()
-            
-            # Update rejection history record
-            latest_rejection.resubmitted_at = datetime.now()
+                resubmission_info = f"[RESUBMITTED on {resubmitted_on} by {user_id}]"
+            
+            # Change status to pending_validation, reset approved_at (approved_by is
+            # kept for the audit trail: it shows who rejected the project) and keep
+            # the original rejection note ahead of the resubmission info. One
+            # UPDATE ... RETURNING, guarded on the current status as in reject_project.
+            update_dict.update(
+                status='pending_validation',
+                approved_at=None,
+                admin_notes=case(
+                    (
+                        func.coalesce(Project.admin_notes, '') != '',
+                        Project.admin_notes + "\n\n" + resubmission_info,
+                    ),
+                    else_=resubmission_info,
+                ),
+                updated_at=func.now(),
+            )
+            project = self.db.execute(
+                update(Project)
+                .where(Project.id == project_id, Project.status.in_(RESUBMITTABLE_STATUSES))
+                .values(**update_dict)
+                .returning(Project)
+            ).scalar_one_or_none()
+            
+            if project is None:
+                # Nothing was updated: report a missing project (404) or a
+                # project that is not rejected (409)
+                current_status = self._get_current_status(project_id)
+                self._ensure_transition_allowed(current_status, 'pending_validation')
+            
+            # Mark the latest rejection record as resubmitted in a single statement.
+            # No lock is needed here: the guarded UPDATE above holds the project
+            # row lock, so concurrent resubmissions of this project are serialized
+            # and the second one fails the status guard.
+            latest_rejection = (
+                select(ProjectRejectionHistory.id)
+                .where(ProjectRejectionHistory.project_id == project_id)
+                .order_by(ProjectRejectionHistory.rejected_at.desc())
+                .limit(1)
+                .cte("latest_rejection")
+            )
+            latest_rejection_id = self.db.execute(
+                update(ProjectRejectionHistory)
+                .where(ProjectRejectionHistory.id == latest_rejection.c.id)
+                .values(resubmitted_at=func.now())
+                .returning(ProjectRejectionHistory.id),
+                execution_options={"synchronize_session": False},
+            ).scalar_one_or_none()
+            
+            if latest_rejection_id is None:
+                # Rolled back below together with the project update
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Rejection history not found for this project"
+                )
             
             self.db.commit()
-            self.db.refresh(project)
+            invalidate_project_caches()
             
-            logger.info(f"Project {project_id} resubmitted successfully by {user_id}. Status changed from 'rejected' to 'pending_validation'")
+            logger.info("Project %s resubmitted successfully by %s. Status changed from 'rejected' to 'pending_validation'", project_id, user_id)
             return project
             
         except HTTPException:
@@ -795,7 +1083,7 @@ class ProjectService:
             raise
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Error resubmitting project {project_id}: {str(e)}")
+            logger.error("Error resubmitting project %s: %s", project_id, e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to resubmit project: {str(e)}"
@@ -813,135 +1101,99 @@ class ProjectService:
         logger.info("Fetching projects commitments summary")
         
         try:
-            # Main query with aggregations
-            # Join with projects to get title
+            # Per-project counts and amounts come precomputed from the
+            # trigger-maintained stats table (one row per project); join with
+            # projects to get title
+            stats = ProjectCommitmentStats
             query = (
                 self.db.query(
-                    Commitment.project_id,
+                    # Labelled with the response keys; the stats columns are NOT NULL
+                    # (default 0), so rows need no Python post-processing
+                    stats.project_id.label("project_reference_id"),
                     Project.title.label("project_title"),
-                    func.count(Commitment.id).label("total_commitments_count"),
+                    stats.commitment_count.label("total_commitments_count"),
                     # Status breakdown counts
-                    func.sum(
-                        case((Commitment.status == "under_review", 1), else_=0)
-                    ).label("under_review_count"),
-                    func.sum(
-                        case((Commitment.status == "approved", 1), else_=0)
-                    ).label("approved_count"),
-                    func.sum(
-                        case((Commitment.status == "rejected", 1), else_=0)
-                    ).label("rejected_count"),
-                    func.sum(
-                        case((Commitment.status == "withdrawn", 1), else_=0)
-                    ).label("withdrawn_count"),
+                    stats.under_review_count.label("status_under_review"),
+                    stats.approved_count.label("status_approved"),
+                    stats.rejected_count.label("status_rejected"),
+                    stats.withdrawn_count.label("status_withdrawn"),
                     # Total amount under review
-                    func.sum(
-                        case(
-                            (Commitment.status == "under_review", Commitment.amount),
-                            else_=Decimal("0")
-                        )
-                    ).label("total_amount_under_review"),
+                    stats.under_review_amount.label("total_amount_under_review"),
                     # Latest commitment date
-                    func.max(Commitment.created_at).label("latest_commitment_date"),
-                )
-                .join(
-                    Project,
-                    Commitment.project_id == Project.project_reference_id,
-                    isouter=False
+                    stats.latest_commitment_at.label("latest_commitment_date"),
+                    # Number of projects, computed alongside the page
+                    func.count().over().label("total_count"),
                 )
-                .group_by(Commitment.project_id, Project.title)
+                .join(Project, stats.project_id == Project.project_reference_id)
+                # Projects whose commitments were all removed keep a zeroed row
+                .filter(stats.commitment_count > 0)
             )
             
-            # Get total count before pagination
-            total = query.count()
-            
-            # Apply pagination and ordering (by latest commitment date desc)
-            # Note: We need to use the alias for ordering since it's in the SELECT
-            results = (
-                query.order_by(func.max(Commitment.created_at).desc())
+            # Apply pagination and ordering (by latest commitment date desc),
+            # read off ix_project_commitment_stats_latest
+            page = (
+                query.order_by(stats.latest_commitment_at.desc())
                 .offset(skip)
                 .limit(limit)
-                .all()
+                .subquery("page")
             )
             
-            # Fetch all valid commitments for all projects in one query (fix N+1 problem)
-            # Only include commitments that are not rejected or withdrawn
-            project_ids = [row.project_id for row in results]
-            all_valid_commitments = (
-                self.db.query(Commitment)
-                .filter(
-                    Commitment.project_id.in_(project_ids),
-                    Commitment.status.in_(["under_review", "approved", "funded", "completed"]),
+            # Best deal per project on the page, picked in SQL with a LATERAL join:
+            # loans with an interest rate first, ordered by lowest rate; otherwise
+            # the highest amount. Only commitments that are not rejected or withdrawn.
+            best_commitment = aliased(Commitment)
+            is_rated_loan = and_(
+                best_commitment.funding_mode == "loan",
+                best_commitment.interest_rate.isnot(None),
+            )
+            best_deal = (
+                select(
+                    best_commitment.amount,
+                    best_commitment.interest_rate,
+                    best_commitment.funding_mode,
                 )
-                .all()
+                .where(
+                    best_commitment.project_id == page.c.project_reference_id,
+                    best_commitment.status.in_(ACTIVE_COMMITMENT_STATUSES),
+                )
+                .order_by(
+                    case((is_rated_loan, 0), else_=1),
+                    case((is_rated_loan, best_commitment.interest_rate)).asc().nullslast(),
+                    best_commitment.amount.desc(),
+                )
+                .limit(1)
+                .lateral("best_deal")
             )
             
-            # Group commitments by project_id for efficient lookup
-            commitments_by_project = {}
-            for commitment in all_valid_commitments:
-                if commitment.project_id not in commitments_by_project:
-                    commitments_by_project[commitment.project_id] = []
-                commitments_by_project[commitment.project_id].append(commitment)
+            # Stream the page in batches and build the response dicts as rows arrive
+            rows = (
+                self.db.query(
+                    page,
+                    best_deal.c.amount.label("best_deal_amount"),
+                    best_deal.c.interest_rate.label("best_deal_interest_rate"),
+                    best_deal.c.funding_mode.label("best_deal_funding_mode"),
+                )
+                .outerjoin(best_deal, true())
+                .order_by(page.c.latest_commitment_date.desc())
+                .yield_per(200)
+            )
             
-            # Process results and find best deal for each project
+            total = None
             summary_list = []
-            for row in results:
-                project_ref_id = row.project_id
-                
-                # Find best deal: For loans, lowest interest rate; for others, highest amount
-                # Use pre-fetched commitments (excluding rejected/withdrawn)
-                project_commitments = commitments_by_project.get(project_ref_id, [])
-                
-                best_deal_amount = None
-                best_deal_interest_rate = None
-                best_deal_funding_mode = None
-                
-                if project_commitments:
-                    # Filter loans with interest rate
-                    loans_with_rate = [
-                        c for c in project_commitments
-                        if c.funding_mode == "loan" and c.interest_rate is not None
-                    ]
-                    
-                    if loans_with_rate:
-                        # Best deal = loan with lowest interest rate
-                        best_commitment = min(
-                            loans_with_rate,
-                            key=lambda x: x.interest_rate
-                        )
-                        best_deal_amount = best_commitment.amount
-                        best_deal_interest_rate = best_commitment.interest_rate
-                        best_deal_funding_mode = best_commitment.funding_mode
-                    else:
-                        # No loans with rate, use highest amount commitment
-                        best_commitment = max(
-                            project_commitments,
-                            key=lambda x: x.amount
-                        )
-                        best_deal_amount = best_commitment.amount
-                        best_deal_interest_rate = best_commitment.interest_rate
-                        best_deal_funding_mode = best_commitment.funding_mode
-                
-                summary_dict = {
-                    "project_reference_id": project_ref_id,
-                    "project_title": row.project_title,
-                    "total_commitments_count": row.total_commitments_count or 0,
-                    "status_under_review": int(row.under_review_count or 0),
-                    "status_approved": int(row.approved_count or 0),
-                    "status_rejected": int(row.rejected_count or 0),
-                    "status_withdrawn": int(row.withdrawn_count or 0),
-                    "total_amount_under_review": row.total_amount_under_review or Decimal("0"),
-                    "best_deal_amount": best_deal_amount,
-                    "best_deal_interest_rate": best_deal_interest_rate,
-                    "best_deal_funding_mode": best_deal_funding_mode,
-                    "latest_commitment_date": row.latest_commitment_date,
-                }
-                summary_list.append(summary_dict)
-            
-            logger.info(f"Retrieved {len(summary_list)} project commitments summaries (total: {total})")
+            for row in rows:
+                item = row._asdict()
+                # Same value on every row
+                total = item.pop("total_count")
+                summary_list.append(item)
+            if total is None:
+                # Past the last project the window has nothing to count over
+                total = query.count() if skip else 0
+            
+            logger.info("Retrieved %s project commitments summaries (total: %s)", len(summary_list), total)
             return summary_list, total
             
         except Exception as e:
-            logger.error(f"Error fetching projects commitments summary: {str(e)}")
+            logger.error("Error fetching projects commitments summary: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch projects commitments summary: {str(e)}"
@@ -951,7 +1203,7 @@ class ProjectService:
         self,
         skip: int = 0,
         limit: int = 100,
-    ) -> Tuple[List[Project], int]:
+    ) -> Tuple[List[FullyFundedProjectResponse], int]:
         """
         Get list of fully funded projects (status = 'funding_completed') with funding parameters:
         - Average interest_rate from approved commitments
@@ -959,67 +1211,43 @@ class ProjectService:
         """
         logger.info("Fetching fully funded projects with funding parameters")
         
-        try:
-            # Query projects with status 'funding_completed'
-            query = self.db.query(Project).filter(
-                Project.status == 'funding_completed'
-            )
-            
-            # Get total count before pagination
-            total = query.count()
-            
-            # Apply ordering: most recent first
-            projects = query.order_by(
-                Project.created_at.desc(),
-                Project.id.desc()
-            ).offset(skip).limit(limit).all()
-            
-            # For each project, calculate funding parameters from approved commitments
-            for project in projects:
-                # Query approved commitments for this project
-                approved_commitments = (
-                    self.db.query(Commitment)
-                    .filter(
-                        Commitment.project_id == project.project_reference_id,
-                        Commitment.status == 'approved'
-                    )
-                    .all()
-                )
-                
-                # Calculate average interest_rate (only from commitments that have interest_rate)
-                interest_rates = [
-                    c.interest_rate for c in approved_commitments
-                    if c.interest_rate is not None
-                ]
-                
-                if interest_rates:
-                    # Use Decimal arithmetic for precision
-                    total_rate = sum(interest_rates)
-                    avg_interest_rate = total_rate / Decimal(str(len(interest_rates)))
-                    # Round to 2 decimal places
-                    setattr(project, "average_interest_rate", round(avg_interest_rate, 2))
-                else:
-                    setattr(project, "average_interest_rate", None)
-                
-                # Count number of investors (number of approved commitments)
-                setattr(project, "number_of_investors", len(approved_commitments))
-            
-            logger.info(f"Retrieved {len(projects)} fully funded projects (total: {total})")
-            return projects, total
-            
-        except Exception as e:
-            logger.error(f"Error fetching fully funded projects: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch fully funded projects: {str(e)}"
-            )
+        # Served from the in-process cache; a miss (or an expired page) loads it
+        projects, total = fully_funded_cache.get_or_set(
+            (skip, limit),
+            lambda: self._load_fully_funded_projects(skip, limit),
+        )
+        
+        logger.info("Retrieved %s fully funded projects (total: %s)", len(projects), total)
+        return projects, total
+    
+    def _load_fully_funded_projects(
+        self,
+        skip: int,
+        limit: int,
+    ) -> Tuple[List[FullyFundedProjectResponse], int]:
+        """Query one fully funded page and its total (uncached)."""
+        # Both statements are built once at import; only skip/limit vary per call
+        total = self.db.execute(FULLY_FUNDED_COUNT_STMT).scalar()
+        
+        # Stream the rows through a server-side cursor in batches and validate
+        # each one into its response model as it arrives
+        projects = [
+            FullyFundedProjectResponse.model_validate(row)
+            for row in self.db.execute(
+                FULLY_FUNDED_PROJECTS_STMT,
+                {"skip": skip, "limit": limit},
+                execution_options={"yield_per": 200},
+            ).mappings()
+        ]
+        return projects, total
     
     def get_projects_funded_by_user(
         self,
         committed_by: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> Tuple[List[Project], int]:
+        after: Optional[str] = None,
+    ) -> Tuple[List[ProjectResponse], int, Optional[str]]:
         """
         Get all projects that have been funded by a specific user.
         
@@ -1032,9 +1260,12 @@ class ProjectService:
             committed_by: User ID who has made commitments
             skip: Number of records to skip for pagination
             limit: Maximum number of records to return
+            after: Keyset cursor (next_cursor of the previous page); when given,
+                   skip is ignored
             
         Returns:
-            Tuple of (list of projects with commitment data attached, total count)
+            Tuple of (list of ProjectResponse items with commitment attached, total count,
+            next_cursor or None on the last page)
         """
         logger.info(
             "Fetching projects funded by user %s, skip=%s, limit=%s",
@@ -1043,89 +1274,94 @@ class ProjectService:
             limit,
         )
         
-        try:
-            # Query to get distinct projects where user has made commitments
-            # Join projects with commitments on project_reference_id
-            query = (
-                self.db.query(Project)
-                .join(
-                    Commitment,
-                    Project.project_reference_id == Commitment.project_id
-                )
-                .filter(Commitment.committed_by == committed_by)
-                .distinct()
-            )
-            
-            # Get total count before pagination
-            total = query.count()
-            
-            # Apply ordering: most recent first
-            projects = (
-                query.order_by(
-                    Project.created_at.desc(),
-                    Project.id.desc()
-                )
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-            
-            # For each project, fetch the latest commitment made by this user
-            # and attach it to the project object for serialization
-            for project in projects:
-                latest_commitment = (
-                    self.db.query(Commitment)
-                    .filter(
-                        Commitment.project_id == project.project_reference_id,
-                        Commitment.committed_by == committed_by,
-                    )
-                    .order_by(Commitment.created_at.desc())
-                    .first()
-                )
-                
-                # Attach commitment to project object
-                # This will be serialized by ProjectResponse schema which has a commitment field
-                if latest_commitment:
-                    setattr(project, "commitment", latest_commitment)
-                else:
-                    setattr(project, "commitment", None)
-            
-            logger.info(
-                "Retrieved %s projects funded by user %s (total: %s)",
-                len(projects),
-                committed_by,
-                total,
-            )
-            
-            return projects, total
-            
-        except Exception as e:
-            logger.error(
-                "Error fetching projects funded by user %s: %s",
-                committed_by,
-                str(e),
+        # Latest commitment made by this user per project (DISTINCT ON keeps
+        # the newest row per project_id)
+        latest_commitment_sq = (
+            select(Commitment)
+            .where(Commitment.committed_by == committed_by)
+            .distinct(Commitment.project_id)
+            .order_by(Commitment.project_id, Commitment.created_at.desc())
+            .subquery("latest_commitment")
+        )
+        latest_commitment = aliased(Commitment, latest_commitment_sq)
+        
+        # Join each project to that commitment; one row per project, and
+        # contains_eager populates Project.commitment from the same row
+        query = (
+            self.db.query(Project)
+            .join(
+                latest_commitment,
+                Project.project_reference_id == latest_commitment.project_id
             )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch projects funded by user: {str(e)}"
+            .options(contains_eager(Project.commitment.of_type(latest_commitment)))
+        )
+        
+        # Get total count before pagination: one per project the user committed
+        # to. Every commitment references an existing project (FK), so this
+        # needs neither the projects table nor the DISTINCT ON subquery.
+        total = self.db.query(func.count(func.distinct(Commitment.project_id))).filter(
+            Commitment.committed_by == committed_by
+        ).scalar()
+        
+        # Apply ordering: most recent first
+        query = query.order_by(Project.created_at.desc(), Project.id.desc())
+        
+        # Keyset when a cursor is given, as in get_projects
+        if after:
+            after_created_at, after_id = decode_cursor(after)
+            query = query.filter(
+                tuple_(Project.created_at, Project.id) < tuple_(after_created_at, after_id)
             )
+        else:
+            if skip > DEEP_OFFSET_WARNING:
+                logger.warning("Deep OFFSET pagination for funded projects (skip=%s); use the after cursor", skip)
+            query = query.offset(skip)
+        
+        # Rows are streamed in batches and validated into ProjectResponse (which
+        # has a commitment field) as they arrive; each read-only project and its
+        # commitment are then released from the session (the viewonly
+        # relationship does not cascade the expunge)
+        projects = []
+        for project in query.limit(limit).yield_per(200):
+            projects.append(ProjectResponse.model_validate(project))
+            self.db.expunge(project)
+            if project.commitment is not None:
+                self.db.expunge(project.commitment)
+        
+        # A full page may have more rows after it
+        next_cursor = None
+        if len(projects) == limit and projects[-1].created_at is not None:
+            next_cursor = encode_cursor(projects[-1].created_at, projects[-1].id)
+        
+        logger.info(
+            "Retrieved %s projects funded by user %s (total: %s)",
+            len(projects),
+            committed_by,
+            total,
+        )
+        
+        return projects, total, next_cursor
     
     def get_distinct_states(self) -> List[str]:
         """Get all distinct states from projects table, ordered alphabetically."""
+        return lookup_cache.get_or_set("states", self._load_distinct_states)
+    
+    def _load_distinct_states(self) -> List[str]:
+        """Query distinct states (uncached)."""
         try:
+            # Trimmed and de-duplicated in SQL (served by ix_projects_state_trim)
+            state = func.trim(Project.state)
             distinct_states = (
-                self.db.query(Project.state)
+                self.db.query(state)
                 .filter(Project.state.isnot(None))
-                .filter(Project.state != "")
+                .filter(state != "")
                 .distinct()
-                .order_by(Project.state)
+                .order_by(state)
                 .all()
             )
-            # Extract state values from tuples (query returns tuples when selecting single column)
-            states = [state[0].strip() for state in distinct_states if state[0] and state[0].strip()]
-            return states
+            return [row[0] for row in distinct_states]
         except Exception as e:
-            logger.error(f"Error fetching distinct states: {str(e)}")
+            logger.error("Error fetching distinct states: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch distinct states: {str(e)}"
@@ -1133,20 +1369,24 @@ class ProjectService:
     
     def get_distinct_municipality_credit_ratings(self) -> List[str]:
         """Get all distinct municipality_credit_rating values from projects table, ordered alphabetically."""
+        return lookup_cache.get_or_set("credit_ratings", self._load_distinct_municipality_credit_ratings)
+    
+    def _load_distinct_municipality_credit_ratings(self) -> List[str]:
+        """Query distinct municipality credit ratings (uncached)."""
         try:
+            # Trimmed and de-duplicated in SQL (served by ix_projects_credit_rating_trim)
+            rating = func.trim(Project.municipality_credit_rating)
             distinct_ratings = (
-                self.db.query(Project.municipality_credit_rating)
+                self.db.query(rating)
                 .filter(Project.municipality_credit_rating.isnot(None))
-                .filter(Project.municipality_credit_rating != "")
+                .filter(rating != "")
                 .distinct()
-                .order_by(Project.municipality_credit_rating)
+                .order_by(rating)
                 .all()
             )
-            # Extract rating values from tuples (query returns tuples when selecting single column)
-            ratings = [rating[0].strip() for rating in distinct_ratings if rating[0] and rating[0].strip()]
-            return ratings
+            return [row[0] for row in distinct_ratings]
         except Exception as e:
-            logger.error(f"Error fetching distinct municipality credit ratings: {str(e)}")
+            logger.error("Error fetching distinct municipality credit ratings: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch distinct municipality credit ratings: {str(e)}"
@@ -1154,29 +1394,18 @@ class ProjectService:
     
     def get_value_ranges(self) -> dict:
         """Get min and max ranges for funding_requirement, commitment_gap, and total_project_cost fields."""
+        return lookup_cache.get_or_set("value_ranges", self._load_value_ranges)
+    
+    def _load_value_ranges(self) -> dict:
+        """Query value ranges (uncached)."""
         try:
-            # Get max funding_requirement (min is always 0)
-            max_funding_requirement_result = (
-                self.db.query(func.max(Project.funding_requirement))
-                .scalar()
-            )
-            max_funding_requirement = Decimal('0') if max_funding_requirement_result is None else max_funding_requirement_result
-            
-            # Get max commitment_gap where not null (min is always 0)
-            max_commitment_gap_result = (
-                self.db.query(func.max(Project.commitment_gap))
-                .filter(Project.commitment_gap.isnot(None))
-                .scalar()
-            )
-            max_commitment_gap = Decimal('0') if max_commitment_gap_result is None else max_commitment_gap_result
-            
-            # Get max total_project_cost where not null (min is always 0)
-            max_total_project_cost_result = (
-                self.db.query(func.max(Project.total_project_cost))
-                .filter(Project.total_project_cost.isnot(None))
-                .scalar()
-            )
-            max_total_project_cost = Decimal('0') if max_total_project_cost_result is None else max_total_project_cost_result
+            # One pass over the table for all three maxima (every min is always 0);
+            # MAX ignores NULLs
+            max_funding_requirement, max_commitment_gap, max_total_project_cost = self.db.query(
+                func.coalesce(func.max(Project.funding_requirement), Decimal('0')),
+                func.coalesce(func.max(Project.commitment_gap), Decimal('0')),
+                func.coalesce(func.max(Project.total_project_cost), Decimal('0')),
+            ).one()
             
             return {
                 "min_funding_requirement": Decimal('0'),
@@ -1187,7 +1416,7 @@ class ProjectService:
                 "max_total_project_cost": max_total_project_cost,
             }
         except Exception as e:
-            logger.error(f"Error fetching value ranges: {str(e)}")
+            logger.error("Error fetching value ranges: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch value ranges: {str(e)}"
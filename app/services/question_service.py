@@ -1,13 +1,17 @@
-from typing import Optional, Tuple, List, Union
+from typing import Optional, Set, Tuple, List, Union
 
 from fastapi import HTTPException, status, UploadFile
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import exists, func, insert, tuple_, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.models.project import Project
 from app.models.question import Question, QuestionReply
 from app.models.question_reply_document import QuestionReplyDocument
 from app.services.file_service import FileService
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.schemas.question import (
     QuestionCreate,
     QuestionUpdate,
@@ -19,20 +23,42 @@ logger = get_logger("services.question")
 class QuestionService:
     def __init__(self, db: Session):
         self.db = db
+        # Project reference IDs already confirmed to exist; the service lives
+        # for one request, so a mutation and its get_question check only once
+        self._existing_projects: Set[str] = set()
 
-    def _validate_project_exists(self, project_id: str) -> Project:
+    def _validate_project_exists(self, project_id: str) -> None:
         """Validate that project exists for the given project_reference_id."""
-        project = (
-            self.db.query(Project)
+        if project_id in self._existing_projects:
+            return
+        project_query = self.db.query(Project).filter(
+            Project.project_reference_id == project_id
+        )
+        if not self.db.query(project_query.exists()).scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project with reference ID '{project_id}' not found",
+            )
+        self._existing_projects.add(project_id)
+
+    def _get_project_organization_id(self, project_id: str) -> str:
+        """Return the organization_id of a project, 404 if it does not exist."""
+        organization_id = (
+            self.db.query(Project.organization_id)
             .filter(Project.project_reference_id == project_id)
-            .first()
+            .scalar()
         )
-        if not project:
+        if organization_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Project with reference ID '{project_id}' not found",
             )
-        return project
+        return organization_id
+
+    def _strict_loading_options(self) -> list:
+        """With STRICT_LOADING on, make relationships without an eager load raise
+        instead of lazy loading (one query per question on a page)."""
+        return [raiseload("*")] if settings.STRICT_LOADING else []
 
     def _validate_question_status_for_answer(self, question: Question) -> None:
         """Ensure question is in a state that can be answered."""
@@ -54,23 +80,23 @@ class QuestionService:
             # Validate project exists
             self._validate_project_exists(data.project_id)
 
-            question_dict = data.model_dump(exclude_unset=True)
+            # Unset and null fields are left out so the column server defaults
+            # (status 'open', is_public true, priority 'normal') apply
+            question_dict = data.model_dump(exclude_unset=True, exclude_none=True)
             # Use user_id from auth context if provided, otherwise fall back to asked_by from request
             if user_id:
                 question_dict["asked_by"] = user_id
                 question_dict["created_by"] = user_id
-            # Ensure default values consistent with DB defaults
-            if "status" not in question_dict or question_dict["status"] is None:
-                question_dict["status"] = "open"
-            if "is_public" not in question_dict or question_dict["is_public"] is None:
-                question_dict["is_public"] = True
-            if "priority" not in question_dict or question_dict["priority"] is None:
-                question_dict["priority"] = "normal"
-
-            question = Question(**question_dict)
-            self.db.add(question)
+
+            # INSERT ... RETURNING hands back the stored row, server defaults
+            # included, without building the object attribute by attribute
+            # and refreshing it after commit
+            question = self.db.execute(
+                insert(Question).values(**question_dict).returning(Question)
+            ).scalar_one()
             self.db.commit()
-            self.db.refresh(question)
+            # A new question has no answer to load for the response
+            set_committed_value(question, "answer", None)
 
             logger.info("Question %s created successfully", question.id)
             return question
@@ -94,33 +120,43 @@ class QuestionService:
         priority: Optional[str] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> Tuple[List[Question], int]:
+        include_total: bool = True,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Question], Optional[int], bool, Optional[str]]:
         """List questions with optional filters and pagination.
         
         Can filter by project_id (project_reference_id) and/or organization_id.
         If project_id is provided, validates that the project exists.
+        
+        Pages are fetched by keyset when ``after`` (the next_cursor of the
+        previous page) is given; ``skip`` is then ignored.
+        
+        Returns (questions, total, has_more, next_cursor). With
+        include_total=False the count is skipped and total is None; has_more is
+        then found by fetching one extra row. next_cursor is None on the last page.
         """
         # Validate project exists if project_id is provided
         if project_id:
             self._validate_project_exists(project_id)
 
-        # Start building query with join to Project if organization_id filter is needed
+        # Answers and their documents are loaded with batched IN queries for the
+        # whole page (selectinload) rather than joined into the paginated query,
+        # which would have to wrap the LIMIT in a subquery and repeat question
+        # rows per document
+        load_options = [
+            selectinload(Question.answer)
+            .selectinload(QuestionReply.documents)
+            .joinedload(QuestionReplyDocument.file),
+            *self._strict_loading_options(),
+        ]
+        query = self.db.query(Question)
+
+        # Join to Project if organization_id filter is needed
         if organization_id:
             query = (
-                self.db.query(Question)
-                .join(Project, Question.project_id == Project.project_reference_id)
-                .options(
-                    joinedload(Question.answer).joinedload(QuestionReply.documents).joinedload(QuestionReplyDocument.file)
-                )
+                query.join(Project, Question.project_id == Project.project_reference_id)
                 .filter(Project.organization_id == organization_id)
             )
-        else:
-            query = (
-                self.db.query(Question)
-                .options(
-                    joinedload(Question.answer).joinedload(QuestionReply.documents).joinedload(QuestionReplyDocument.file)
-                )
-            )
 
         # Apply project_id filter if provided
         if project_id:
@@ -134,34 +170,91 @@ class QuestionService:
         if priority:
             query = query.filter(Question.priority == priority)
 
-        total = query.count()
+        query = query.order_by(Question.created_at.desc(), Question.id.desc())
+        count_query = query
 
-        questions = (
-            query.order_by(Question.created_at.desc(), Question.id.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        # Keyset: rows that sort after the cursor, read off the
+        # (project_id, created_at DESC, id DESC) index; OFFSET reads and
+        # discards skip rows
+        if after:
+            after_created_at, after_id = decode_cursor(after)
+            query = query.filter(
+                tuple_(Question.created_at, Question.id) < tuple_(after_created_at, after_id)
+            )
 
-        return questions, total
+        # Deferred join: with an offset, only ids are walked past the skipped
+        # rows and full rows are loaded for the page alone
+        deferred = bool(skip) and not after
+        if deferred:
+            page_query = query.with_entities(Question.id).offset(skip)
+        else:
+            page_query = query.options(*load_options)
+
+        if include_total and not after:
+            # The total comes back with the page as a COUNT(*) OVER () window column
+            # (evaluated before OFFSET/LIMIT) instead of a separate count query
+            rows = (
+                page_query.add_columns(func.count().over().label("total_count"))
+                .limit(limit)
+                .all()
+            )
+            page = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total_count
+            else:
+                # Past the last row the window has nothing to count over
+                total = count_query.count() if skip else 0
+            has_more = skip + len(page) < total
+        else:
+            # A cursor filters rows out of the window, so that total needs its
+            # own count
+            total = count_query.count() if include_total else None
+            rows = page_query.limit(limit + 1).all()
+            has_more = len(rows) > limit
+            page = [row[0] for row in rows[:limit]] if deferred else rows[:limit]
+
+        if deferred:
+            questions = (
+                self.db.query(Question)
+                .options(*load_options)
+                .filter(Question.id.in_(page))
+                .order_by(Question.created_at.desc(), Question.id.desc())
+                .all()
+            ) if page else []
+        else:
+            questions = page
 
-    def get_question(self, project_id: str, question_id: int) -> Question:
-        """Get a single question for a project, including its answer and documents."""
-        self._validate_project_exists(project_id)
+        next_cursor = None
+        if has_more and questions and questions[-1].created_at is not None:
+            next_cursor = encode_cursor(questions[-1].created_at, questions[-1].id)
 
-        question = (
-            self.db.query(Question)
-            .options(
-                joinedload(Question.answer).joinedload(QuestionReply.documents).joinedload(QuestionReplyDocument.file)
-            )
-            .filter(Question.id == question_id, Question.project_id == project_id)
-            .first()
+        return questions, total, has_more, next_cursor
+
+    def get_question(self, project_id: str, question_id: int, reload: bool = False) -> Question:
+        """Get a single question for a project, including its answer and documents.
+
+        A question already loaded in this session is returned from the identity
+        map without a query; pass reload=True after changing its answer's
+        documents outside the relationship.
+        """
+        question = self.db.get(
+            Question,
+            question_id,
+            options=[
+                joinedload(Question.answer).joinedload(QuestionReply.documents).joinedload(QuestionReplyDocument.file),
+                *self._strict_loading_options(),
+            ],
+            populate_existing=reload,
         )
-        if not question:
+        if question is None or question.project_id != project_id:
+            # Only a miss needs to tell a missing project from a missing question;
+            # a found question proves its project exists (foreign key)
+            self._validate_project_exists(project_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question with ID {question_id} not found for project '{project_id}'",
             )
+        self._existing_projects.add(project_id)
         return question
 
     def update_question(
@@ -175,26 +268,41 @@ class QuestionService:
 
         If the question already has an answer, modification is not allowed.
         """
-        question = self.get_question(project_id, question_id)
-
-        if question.answer:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Cannot modify question because it already has an answer",
-            )
-
         update_dict = data.model_dump(exclude_unset=True)
         # Set updated_by from auth context if provided
         if user_id:
-            question.updated_by = user_id
-        
-        for field, value in update_dict.items():
-            setattr(question, field, value)
+            update_dict["updated_by"] = user_id
+        update_dict["updated_at"] = func.now()
 
         try:
+            # One UPDATE ... RETURNING, guarded on the question having no answer
+            question = self.db.execute(
+                update(Question)
+                .where(
+                    Question.id == question_id,
+                    Question.project_id == project_id,
+                    ~exists().where(QuestionReply.question_id == Question.id),
+                )
+                .values(**update_dict)
+                .returning(Question)
+            ).scalar_one_or_none()
+
+            if question is None:
+                # Nothing was updated: report a missing project or question (404)
+                # or a question that is already answered (409)
+                self.get_question(project_id, question_id)
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Cannot modify question because it already has an answer",
+                )
+
             self.db.commit()
-            self.db.refresh(question)
+            # The guard above means there is no answer to load for the response
+            set_committed_value(question, "answer", None)
             return question
+        except HTTPException:
+            self.db.rollback()
+            raise
         except Exception as exc:
             self.db.rollback()
             logger.error("Error updating question %s: %s", question_id, str(exc))
@@ -362,8 +470,7 @@ class QuestionService:
         
         # Fetch organization_id from project if not provided and files are being uploaded
         if files and not organization_id:
-            project = self._validate_project_exists(project_id)
-            organization_id = project.organization_id
+            organization_id = self._get_project_organization_id(project_id)
             logger.info(
                 "Auto-fetched organization_id=%s from project %s for file upload",
                 organization_id,
@@ -371,18 +478,22 @@ class QuestionService:
             )
 
         try:
-            # Create answer first to get the ID
+            # Attach the answer and mark the question answered in one flush; the
+            # INSERT and UPDATE return their server defaults (eager_defaults), so
+            # the response is built from these objects without a reload
             answer = QuestionReply(
-                question_id=question.id,
                 replied_by_user_id=replied_by_user_id,
                 reply_text=reply_text,
                 created_by=replied_by_user_id,
+                documents=[],
             )
-            self.db.add(answer)
+            question.answer = answer
+            question.status = "answered"
             self.db.flush()  # Get the ID without committing
             
             # Upload and link documents if provided
-            if files and organization_id:
+            uploads = bool(files and organization_id)
+            if uploads:
                 self._upload_and_link_answer_documents(
                     question_reply_id=answer.id,
                     files=files,
@@ -391,13 +502,10 @@ class QuestionService:
                     uploaded_by=replied_by_user_id,
                 )
 
-            # Update question status to answered
-            question.status = "answered"
-
             self.db.commit()
-            self.db.refresh(question)
-            # Reload with documents
-            question = self.get_question(project_id, question_id)
+            if uploads:
+                # Documents were linked by ID; reload them with their files
+                question = self.get_question(project_id, question_id, reload=True)
             return question
         except HTTPException:
             self.db.rollback()
@@ -454,8 +562,7 @@ class QuestionService:
         
         # Fetch organization_id from project if not provided and files are being uploaded
         if files and not organization_id:
-            project = self._validate_project_exists(project_id)
-            organization_id = project.organization_id
+            organization_id = self._get_project_organization_id(project_id)
             logger.info(
                 "Auto-fetched organization_id=%s from project %s for file upload",
                 organization_id,
@@ -487,7 +594,7 @@ class QuestionService:
 
             self.db.commit()
             # Reload with documents
-            question = self.get_question(project_id, question_id)
+            question = self.get_question(project_id, question_id, reload=True)
             return question
         except HTTPException:
             self.db.rollback()
@@ -583,12 +690,13 @@ class QuestionService:
             )
 
         try:
-            self.db.delete(answer)
+            # Detaching the answer deletes it (delete-orphan) and leaves the
+            # returned question without it, so no refresh is needed
+            question.answer = None
             # Reset question status back to open
             question.status = "open"
 
             self.db.commit()
-            self.db.refresh(question)
             return question
         except Exception as exc:
             self.db.rollback()
@@ -0,0 +1,72 @@
+"""
+In-process TTL cache for read-mostly query results.
+
+Entries live in the worker process only; each worker keeps its own copy, so
+writers invalidate the cache they can reach and the TTL bounds how stale the
+other workers can be. Keep TTLs to a few seconds for data that writes change.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger("utils.cache")
+
+
+class TTLCache:
+    """Thread-safe mapping of key -> value that expires entries after ``ttl_seconds``.
+
+    When ``maxsize`` is set, storing into a full cache first drops expired
+    entries and then, if still full, the oldest one.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, maxsize: Optional[int] = None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        # Bumped by clear(); a load that started before a clear is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, calling ``loader`` on a miss or expiry.
+
+        ``loader`` runs outside the lock; concurrent misses for the same key may
+        both load, and the last one stored wins. A value loaded across a
+        ``clear()`` is returned but not stored, since it may predate the write
+        that triggered the clear.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            now = time.monotonic()
+            if self.maxsize is not None and key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict(now)
+            self._entries[key] = (now + self.ttl_seconds, value)
+        return value
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry (caller holds the lock)"""
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order: the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+        logger.debug("Cleared %s cache", self.name)
@@ -0,0 +1,80 @@
+"""
+Shared fixtures for the query-count tests.
+
+The tests run against a real Postgres database, migrated to head
+(``alembic upgrade head``), whose URL is given in TEST_DATABASE_URL. Without
+it the database tests are skipped. Each test runs inside a transaction that
+is rolled back afterwards, so the database is left unchanged.
+"""
+import os
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+# The settings require a Perdix token at import; the tests never call Perdix
+os.environ.setdefault("PERDIX_JWT", "test")
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set; query-count tests need a migrated Postgres database")
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine) -> Iterator[Session]:
+    """Session bound to one connection whose outer transaction is rolled back after the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )()
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def assert_max_queries(db):
+    """
+    Context manager that fails the test when the block runs more than ``n``
+    statements on the session's connection.
+
+        with assert_max_queries(2):
+            service.get_fully_funded_projects()
+
+    Statements are counted with a ``before_cursor_execute`` listener, so a
+    per-row lazy load or lookup inside the block shows up in the count.
+    """
+    @contextmanager
+    def _assert_max_queries(n: int) -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db.connection()
+        event.listen(connection, "before_cursor_execute", count_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", count_statement)
+        assert len(statements) <= n, (
+            f"Expected at most {n} queries, got {len(statements)}:\n" + "\n\n".join(statements)
+        )
+
+    return _assert_max_queries
@@ -0,0 +1,83 @@
+"""
+Statement counts for the project listings that used to issue per-project
+queries: the commitments summary, the fully funded listing and the
+funded-by-user listing. Each one must stay at a fixed number of statements
+however many projects are on the page.
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.models.commitment import Commitment
+from app.models.project import Project
+from app.services.project_service import ProjectService, invalidate_project_caches
+
+LENDER = "query-count-lender"
+PROJECT_COUNT = 3
+
+
+@pytest.fixture
+def funded_projects(db):
+    """Fully funded projects, each with approved commitments from two lenders."""
+    projects = [
+        Project(
+            organization_type="municipality",
+            organization_id="query-count-org",
+            project_reference_id=f"QC-TEST-{index}",
+            title=f"Query count project {index}",
+            contact_person="Tester",
+            funding_requirement=Decimal("1000000"),
+            status="funding_completed",
+        )
+        for index in range(PROJECT_COUNT)
+    ]
+    db.add_all(projects)
+    db.flush()
+
+    db.add_all(
+        Commitment(
+            project_id=project.project_reference_id,
+            organization_type="lender",
+            organization_id="query-count-lender-org",
+            committed_by=committed_by,
+            amount=Decimal("500000"),
+            funding_mode="loan",
+            interest_rate=Decimal("8.50"),
+            status="approved",
+        )
+        for project in projects
+        for committed_by in (LENDER, "query-count-other-lender")
+    )
+    db.flush()
+
+    # Cached pages from another test would hide the queries being counted
+    invalidate_project_caches()
+    yield projects
+    invalidate_project_caches()
+
+
+def test_commitments_summary_query_count(db, funded_projects, assert_max_queries):
+    # Page, window total and LATERAL best deal in one statement
+    with assert_max_queries(1):
+        summary, total = ProjectService(db).get_projects_commitments_summary()
+
+    assert total >= PROJECT_COUNT
+    assert len(summary) >= PROJECT_COUNT
+
+
+def test_fully_funded_projects_query_count(db, funded_projects, assert_max_queries):
+    # Count, then the page with its stats join
+    with assert_max_queries(2):
+        projects, total = ProjectService(db).get_fully_funded_projects()
+
+    assert total >= PROJECT_COUNT
+    assert len(projects) >= PROJECT_COUNT
+
+
+def test_projects_funded_by_user_query_count(db, funded_projects, assert_max_queries):
+    # Count, then the page with the latest commitment joined in
+    with assert_max_queries(2):
+        projects, total, _ = ProjectService(db).get_projects_funded_by_user(LENDER)
+
+    assert total == PROJECT_COUNT
+    assert all(project.commitment is not None for project in projects)